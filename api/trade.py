@@ -18,7 +18,7 @@ from src.trading import (
     TradeResult,
     get_crypto_currency,
     is_supabase_configured,
-    process_symbol,
+    process_symbols,
 )
 
 
@@ -87,17 +87,16 @@ def run_trading_cycle() -> dict:
         "symbols": [],
     }
 
-    # 各通貨ペアを処理
-    for symbol_config in config.symbols:
-        try:
-            result = process_symbol(exchange, config, symbol_config)
-            save_trade_to_db(result)
-            results["symbols"].append(result_to_dict(result))
-        except Exception as e:
+    # 各通貨ペアを並行処理（結果の順序はconfig.symbolsと同じ）
+    for result in process_symbols(exchange, config, config.symbols):
+        if result.error is not None:
             results["symbols"].append({
-                "symbol": symbol_config.symbol,
-                "error": str(e),
+                "symbol": result.symbol,
+                "error": result.error,
             })
+            continue
+        save_trade_to_db(result)
+        results["symbols"].append(result_to_dict(result))
 
     return results
 
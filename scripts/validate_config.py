@@ -0,0 +1,53 @@
+"""SymbolConfigの環境変数フィールド定義を検証するスクリプト。
+
+実行時ではなくコミット前にフィールド定義の不備
+（キャスト不能な型・デフォルトの欠落）を検出する。
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import _ENV_SYMBOL_FIELDS
+
+# 環境変数文字列からキャストできる型
+SUPPORTED_CASTS = (int, float, str)
+
+
+def main() -> int:
+    errors = []
+
+    for name, suffix, cast, default in _ENV_SYMBOL_FIELDS:
+        if cast not in SUPPORTED_CASTS:
+            errors.append(
+                f"{name}: 型 {cast!r} は環境変数からキャストできません"
+            )
+            continue
+        if default is None:
+            errors.append(
+                f"{name}: デフォルト値がありません"
+                "（dataclassのデフォルトか_REQUIRED_FIELD_DEFAULTSに追加してください）"
+            )
+            continue
+        try:
+            cast(default)
+        except ValueError:
+            errors.append(
+                f"{name}: デフォルト値 '{default}' を {cast.__name__} にキャストできません"
+            )
+
+    if errors:
+        print("=== SymbolConfig検証エラー ===")
+        for error in errors:
+            print(f"  NG: {error}")
+        return 1
+
+    print(f"OK: {len(_ENV_SYMBOL_FIELDS)}個の環境変数フィールドを検証しました")
+    for name, suffix, cast, default in _ENV_SYMBOL_FIELDS:
+        print(f"  {name} <- {{PREFIX}}_{suffix} ({cast.__name__}, default={default})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
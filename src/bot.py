@@ -5,21 +5,23 @@
 
 import csv
 import logging
+import os
 import sys
 import time
 from datetime import datetime
-from decimal import Decimal
 from pathlib import Path
 
 # プロジェクトルートをパスに追加
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.config import Strategy, get_config
+from src.config import Strategy
 from src.exchange import Exchange
+from src.position import load_all_positions
 from src.trading import (
     TradeResult,
     get_crypto_currency,
     is_supabase_configured,
+    log_cycle_timings,
     process_symbol,
 )
 
@@ -38,13 +40,19 @@ def setup_logging() -> None:
             logging.StreamHandler(),
         ],
     )
+    # 取引CSVの出力先はプロセス起動時に1回だけ作成する
+    LOGS_DIR.mkdir(exist_ok=True)
+
+
+# trades.csvにヘッダーが書き込み済みか（プロセス内で1回だけstatする）
+_csv_header_written: bool | None = None
 
 
 def log_trade_to_csv(
     timestamp: datetime,
     action: str,
     symbol: str,
-    amount: Decimal,
+    amount: float,
     price: float,
     balance_jpy: float,
     balance_crypto: float,
@@ -52,16 +60,20 @@ def log_trade_to_csv(
     order_id: str | None = None,
 ) -> None:
     """取引をCSVに記録する。"""
-    LOGS_DIR.mkdir(exist_ok=True)
+    global _csv_header_written
+    if _csv_header_written is None:
+        # 初回のみディレクトリと既存ファイルを確認する
+        LOGS_DIR.mkdir(exist_ok=True)
+        _csv_header_written = TRADES_LOG.exists()
 
-    file_exists = TRADES_LOG.exists()
     with open(TRADES_LOG, "a", newline="") as f:
         writer = csv.writer(f)
-        if not file_exists:
+        if not _csv_header_written:
             writer.writerow([
                 "timestamp", "action", "symbol", "amount", "price",
                 "balance_jpy", "balance_crypto", "signal", "order_id",
             ])
+            _csv_header_written = True
         writer.writerow([
             timestamp.isoformat(), action, symbol, str(amount), price,
             balance_jpy, balance_crypto, signal, order_id or "",
@@ -69,15 +81,15 @@ def log_trade_to_csv(
 
 
 def log_trade(result: TradeResult) -> None:
-    """取引をログに記録する（CSV + Supabase）。"""
+    """取引をCSVに記録する（ローカル用）。
+
+    Supabaseへはサイクル末尾にflush_trade_logsでまとめて送信する。
+    """
     if result.action == "none" or result.amount is None:
         return
 
-    timestamp = datetime.now()
-
-    # CSVに保存（ローカル用）
     log_trade_to_csv(
-        timestamp=timestamp,
+        timestamp=datetime.now(),
         action=result.action,
         symbol=result.symbol,
         amount=result.amount,
@@ -88,32 +100,49 @@ def log_trade(result: TradeResult) -> None:
         order_id=result.order_id,
     )
 
-    # Supabaseに保存（設定されている場合）
-    if is_supabase_configured():
-        try:
-            from src.database import save_trade_log
-
-            save_trade_log(
-                timestamp=timestamp,
-                environment="production",  # bitFlyerは本番のみ
-                action=result.action,
-                symbol=result.symbol,
-                amount=result.amount,
-                price=result.price,
-                balance_usdt=result.balance_jpy,  # JPYをUSDTカラムに保存
-                balance_btc=result.balance_crypto,
-                signal=result.signal,
-                order_id=result.order_id,
-            )
-        except Exception as e:
-            logger.warning(f"Failed to save to Supabase: {e}")
+
+def flush_trade_logs(results: list[TradeResult]) -> None:
+    """サイクル内の取引をSupabase送信キューにまとめて積む。
+
+    実際の送信はバックグラウンドスレッドがバッチで行うため、
+    取引ループはネットワーク往復を待たない。
+    """
+    if not is_supabase_configured():
+        return
+
+    executed = [r for r in results if r.action != "none" and r.amount is not None]
+    if not executed:
+        return
+
+    from src.database import build_trade_log_row, enqueue_trade_log
+
+    timestamp = datetime.now()
+    rows = [
+        build_trade_log_row(
+            timestamp=timestamp,
+            environment="production",  # bitFlyerは本番のみ
+            action=result.action,
+            symbol=result.symbol,
+            amount=result.amount,
+            price=result.price,
+            balance_usdt=result.balance_jpy,  # JPYをUSDTカラムに保存
+            balance_btc=result.balance_crypto,
+            signal=result.signal,
+            order_id=result.order_id,
+        )
+        for result in executed
+    ]
+
+    for row in rows:
+        enqueue_trade_log(row)
 
 
 def run_bot(interval_seconds: int = 3600) -> None:
     """Botメインループを実行する。"""
     setup_logging()
 
-    config = get_config()
+    # 遅延読み込みされた設定（src/config.pyのモジュール__getattr__経由）
+    from src.config import config
 
     logger.info("=" * 60)
     logger.info("Starting multi-currency trading bot (bitFlyer)...")
@@ -136,8 +165,10 @@ def run_bot(interval_seconds: int = 3600) -> None:
     logger.info("=" * 60)
 
     logger.warning("!!! TRADING WITH REAL MONEY (bitFlyer) !!!")
-    logger.warning("Press Ctrl+C within 10 seconds to cancel...")
-    time.sleep(10)
+    # 対話実行時のみCtrl-C猶予を設ける（CI・自動再起動では10秒待たない）
+    if sys.stdin.isatty() and os.environ.get("CONFIRM_TRADING_SKIP_WAIT") != "yes":
+        logger.warning("Press Ctrl+C within 10 seconds to cancel...")
+        time.sleep(10)
 
     exchange = Exchange.from_config(config)
 
@@ -146,7 +177,11 @@ def run_bot(interval_seconds: int = 3600) -> None:
             logger.info("=" * 40)
             logger.info(f"Trading cycle started at {datetime.now().isoformat()}")
 
+            # ポジションはサイクル先頭で一括ロードして各シンボルに渡す
+            positions = load_all_positions()
+
             # 各通貨ペアを処理
+            cycle_results: list[TradeResult] = []
             for symbol_config in config.symbols:
                 crypto = get_crypto_currency(symbol_config.symbol)
                 logger.info(
@@ -154,11 +189,20 @@ def run_bot(interval_seconds: int = 3600) -> None:
                     f"({symbol_config.strategy.value}) ---"
                 )
                 try:
-                    result = process_symbol(exchange, config, symbol_config)
+                    result = process_symbol(
+                        exchange, config, symbol_config, positions=positions
+                    )
                     log_trade(result)
+                    cycle_results.append(result)
                 except Exception as e:
                     logger.error(f"[{symbol_config.symbol}] Error: {e}")
 
+            # Supabaseへはサイクル分をまとめて1リクエストで送信
+            flush_trade_logs(cycle_results)
+
+            # サイクル内の処理別所要時間のサマリーを出力
+            log_cycle_timings()
+
             logger.info(f"Sleeping for {interval_seconds} seconds...")
             time.sleep(interval_seconds)
 
@@ -6,13 +6,24 @@ bitFlyerにはテストネットがないため、本番環境のみ。
 """
 
 import os
-from dataclasses import dataclass
-from enum import Enum
+import types
+from dataclasses import MISSING, dataclass, field, fields
+from decimal import Decimal
+from enum import StrEnum
+from typing import Mapping
 
 from dotenv import load_dotenv
 
-# .envファイルがあれば読み込む（ローカル開発用）
-load_dotenv()
+# .envの読み込みは最初のload_configまで遅延する（importごとの再パースを避ける）
+_dotenv_loaded = False
+
+
+def _ensure_env() -> None:
+    """.envファイルがあれば読み込む（ローカル開発用、1回のみ）。"""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
 
 # Supabaseテーブル名（複数アプリ共有のためプレフィックス付き）
 TABLE_PREFIX = "kaso_trade__"
@@ -20,13 +31,17 @@ TRADE_LOGS_TABLE = f"{TABLE_PREFIX}trade_logs"
 POSITIONS_TABLE = f"{TABLE_PREFIX}positions"
 
 
-class Strategy(Enum):
+class Strategy(StrEnum):
     """取引戦略。"""
     RSI_CONTRARIAN = "rsi_contrarian"  # RSI逆張り
     MA_CROSSOVER = "ma_crossover"  # 移動平均クロスオーバー順張り
 
 
-@dataclass(frozen=True)
+# 値 → メンバーのO(1)逆引き（環境変数パース用）
+_STRATEGY_BY_VALUE = {s.value: s for s in Strategy}
+
+
+@dataclass(frozen=True, slots=True)
 class SymbolConfig:
     """通貨ペアごとの設定。"""
     symbol: str  # 例: "BTC/JPY"
@@ -43,8 +58,55 @@ class SymbolConfig:
     ma_short_period: int = 25
     ma_long_period: int = 75
 
+    # シンボルから導出される定数（毎サイクルの再計算を避けるため事前計算）
+    crypto: str = field(init=False)  # 例: "BTC"
+    min_balance: float = field(init=False)  # ポジション判定に使う最小残高
+    order_unit: Decimal = field(init=False)  # bitFlyerの注文単位
+    tick_count: int = field(init=False)  # 注文単位あたりのティック数
+
+    def __post_init__(self) -> None:
+        # frozen=Trueのためobject.__setattr__で設定する
+        crypto = self.symbol.split("/")[0]
+        object.__setattr__(self, "crypto", crypto)
+        object.__setattr__(
+            self, "min_balance", {"BTC": 0.001}.get(crypto, 0.01)
+        )
+        object.__setattr__(
+            self, "order_unit",
+            {"BTC": Decimal("0.001")}.get(crypto, Decimal("0.01")),
+        )
+        object.__setattr__(
+            self, "tick_count", {"BTC": 1000}.get(crypto, 100)
+        )
+
+
+# dataclass側にデフォルトを持たない環境変数フィールドの補完値
+_REQUIRED_FIELD_DEFAULTS = {
+    "max_position_percent": "0.35",
+    "stop_loss_percent": "0.10",
+}
+
+# 環境変数から読み込むSymbolConfigフィールドの
+# (フィールド名, 環境変数サフィックス, キャスト型, デフォルト文字列)。
+# キャスト型はフィールドのアノテーションから導出されるため、
+# フィールドを追加すれば対応する環境変数も自動的に読まれる。
+_ENV_SYMBOL_FIELDS = tuple(
+    (
+        f.name,
+        f.name.upper(),
+        f.type,
+        _REQUIRED_FIELD_DEFAULTS.get(
+            f.name, str(f.default) if f.default is not MISSING else None
+        ),
+    )
+    for f in fields(SymbolConfig)
+    if f.name not in (
+        "symbol", "strategy", "crypto", "min_balance", "order_unit", "tick_count"
+    )
+)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Config:
     """アプリケーション設定。"""
 
@@ -58,6 +120,17 @@ class Config:
     # 通貨ペアごとの設定リスト
     symbols: list[SymbolConfig]
 
+    # シンボル → 設定のO(1)逆引き（リストの線形探索を避ける）
+    by_symbol: Mapping[str, SymbolConfig] = field(init=False)
+
+    def __post_init__(self) -> None:
+        # frozen=Trueのためobject.__setattr__で設定する
+        object.__setattr__(
+            self,
+            "by_symbol",
+            types.MappingProxyType({s.symbol: s for s in self.symbols}),
+        )
+
 
 def load_config() -> Config:
     """環境変数から設定を読み込む。
@@ -68,6 +141,8 @@ def load_config() -> Config:
     Raises:
         ValueError: 必須の環境変数が設定されていない場合
     """
+    _ensure_env()
+
     # APIキー
     api_key = os.environ.get("BITFLYER_API_KEY", "")
     api_secret = os.environ.get("BITFLYER_API_SECRET", "")
@@ -113,63 +188,37 @@ def _load_symbol_configs() -> list[SymbolConfig]:
     - ETH_MA_SHORT_PERIOD=25
     - ETH_MA_LONG_PERIOD=75
     """
-    symbols_str = os.environ.get("SYMBOLS", "BTC/JPY")
+    env = os.environ
+
+    symbols_str = env.get("SYMBOLS", "BTC/JPY")
     symbol_list = [s.strip() for s in symbols_str.split(",")]
 
+    # 全シンボル共通のフォールバック値はループ外で1回だけ読む
+    shared_defaults = {
+        suffix: env.get(suffix, default)
+        for _, suffix, _, default in _ENV_SYMBOL_FIELDS
+    }
+
     configs = []
     for symbol in symbol_list:
         # BTC/JPY → BTC
         prefix = symbol.split("/")[0].upper()
 
         # 戦略を取得
-        strategy_str = os.environ.get(f"{prefix}_STRATEGY", "rsi_contrarian")
-        strategy = Strategy(strategy_str)
-
-        # 共通設定
-        max_position = float(os.environ.get(
-            f"{prefix}_MAX_POSITION_PERCENT",
-            os.environ.get("MAX_POSITION_PERCENT", "0.35")
-        ))
-        stop_loss = float(os.environ.get(
-            f"{prefix}_STOP_LOSS_PERCENT",
-            os.environ.get("STOP_LOSS_PERCENT", "0.10")
-        ))
-
-        # RSI設定
-        rsi_period = int(os.environ.get(
-            f"{prefix}_RSI_PERIOD",
-            os.environ.get("RSI_PERIOD", "14")
-        ))
-        rsi_oversold = int(os.environ.get(
-            f"{prefix}_RSI_OVERSOLD",
-            os.environ.get("RSI_OVERSOLD", "30")
-        ))
-        rsi_overbought = int(os.environ.get(
-            f"{prefix}_RSI_OVERBOUGHT",
-            os.environ.get("RSI_OVERBOUGHT", "70")
-        ))
-
-        # MA設定
-        ma_short = int(os.environ.get(
-            f"{prefix}_MA_SHORT_PERIOD",
-            os.environ.get("MA_SHORT_PERIOD", "25")
-        ))
-        ma_long = int(os.environ.get(
-            f"{prefix}_MA_LONG_PERIOD",
-            os.environ.get("MA_LONG_PERIOD", "75")
-        ))
-
-        configs.append(SymbolConfig(
-            symbol=symbol,
-            strategy=strategy,
-            max_position_percent=max_position,
-            stop_loss_percent=stop_loss,
-            rsi_period=rsi_period,
-            rsi_oversold=rsi_oversold,
-            rsi_overbought=rsi_overbought,
-            ma_short_period=ma_short,
-            ma_long_period=ma_long,
-        ))
+        strategy_str = env.get(f"{prefix}_STRATEGY", "rsi_contrarian")
+        strategy = _STRATEGY_BY_VALUE.get(strategy_str)
+        if strategy is None:
+            raise ValueError(
+                f"Unknown strategy '{strategy_str}' for {symbol}. "
+                f"Valid strategies: {', '.join(_STRATEGY_BY_VALUE)}"
+            )
+
+        # フィールドのアノテーション型でキャストしながら環境変数を読む
+        kwargs = {
+            name: cast(env.get(f"{prefix}_{suffix}", shared_defaults[suffix]))
+            for name, suffix, cast, _ in _ENV_SYMBOL_FIELDS
+        }
+        configs.append(SymbolConfig(symbol=symbol, strategy=strategy, **kwargs))
 
     return configs
 
@@ -188,3 +237,16 @@ def get_config() -> Config:
     if _config is None:
         _config = load_config()
     return _config
+
+
+def __getattr__(name: str):
+    """`from src.config import config` で遅延読み込みした設定を返す。
+
+    初回アクセスで読み込み、以降はモジュール辞書のC実装の参照になるため
+    `get_config()` の毎回のNoneチェックより軽い。
+    """
+    if name == "config":
+        cfg = get_config()
+        globals()["config"] = cfg  # 次回からはモジュール辞書から直接解決される
+        return cfg
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
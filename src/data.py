@@ -5,24 +5,56 @@ KuCoinからOHLCVデータを取得する。
 （価格変動パターンは同等のため、RSI/MA計算に使用可能）
 """
 
+import functools
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
 
 import ccxt
+import numpy as np
 import pandas as pd
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
-# OHLCVデータ取得用（APIキー不要）
-_kucoin: ccxt.kucoin | None = None
+# OHLCVデータ取得用クライアント（APIキー不要、プロバイダーごとにシングルトン）
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(name: str) -> ccxt.Exchange:
+    """OHLCVデータ取得用のccxtクライアントを取得する。
+
+    実際に使うプロバイダーのクライアントだけを構築する
+    （ccxtのクライアント生成はマーケット情報のパース込みで重い）。
+    lru_cacheがプロバイダーごとに1つだけ生成されることを保証するため、
+    手書きのロック付きダブルチェックは不要。
+
+    Args:
+        name: ccxtの取引所ID（例: 'kucoin', 'bitbank'）
+
+    Returns:
+        プロバイダーごとに1つだけ生成されるccxtクライアント
+    """
+    client = getattr(ccxt, name)({"enableRateLimit": True})
+    # keep-alive + コネクションプールでTLSハンドシェイクを抑える
+    client.session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=3),
+    )
+    client.session.headers["Connection"] = "keep-alive"
+    logger.info("%s client initialized for OHLCV data", name)
+    return client
 
 
 def get_kucoin() -> ccxt.kucoin:
     """KuCoinクライアントを取得する（OHLCVデータ用）。"""
-    global _kucoin
-    if _kucoin is None:
-        _kucoin = ccxt.kucoin({"enableRateLimit": True})
-        logger.info("KuCoin client initialized for OHLCV data")
-    return _kucoin
+    return get_client("kucoin")
+
+
+def get_bitbank() -> ccxt.bitbank:
+    """bitbankクライアントを取得する（JPY建てOHLCVデータ用）。"""
+    return get_client("bitbank")
 
 
 def ohlcv_to_dataframe(ohlcv: list[list]) -> pd.DataFrame:
@@ -34,13 +66,54 @@ def ohlcv_to_dataframe(ohlcv: list[list]) -> pd.DataFrame:
     Returns:
         DataFrameに変換されたOHLCVデータ
     """
-    df = pd.DataFrame(
-        ohlcv,
-        columns=["timestamp", "open", "high", "low", "close", "volume"]
+    # list[list]のままDataFrameに渡すとセル単位の型推論が走るため、
+    # 先にfloat64の2次元配列へ変換して列スライスから構築する
+    arr = np.asarray(ohlcv, dtype=np.float64).reshape(-1, 6)
+    timestamps = arr[:, 0].astype("int64")
+    index = pd.DatetimeIndex(pd.to_datetime(timestamps, unit="ms"), name="datetime")
+    return pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            "open": arr[:, 1],
+            "high": arr[:, 2],
+            "low": arr[:, 3],
+            "close": arr[:, 4],
+            "volume": arr[:, 5],
+        },
+        index=index,
     )
-    df["datetime"] = pd.to_datetime(df["timestamp"], unit="ms")
-    df.set_index("datetime", inplace=True)
-    return df
+
+
+class OHLCVArrays(NamedTuple):
+    """OHLCVデータの列ごとのnumpy配列。
+
+    シグナル判定のホットパスはfloat64の列演算しか行わないため、
+    DataFrameのインデックスやBlockManagerを経由せず配列のまま扱う。
+    配列はキャッシュと共有されるため書き込み不可にしてある。
+    """
+
+    timestamp: np.ndarray  # int64（ミリ秒）
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+
+def ohlcv_to_arrays(ohlcv: list[list]) -> OHLCVArrays:
+    """OHLCVデータを列ごとのnumpy配列に変換する。
+
+    Args:
+        ohlcv: OHLCVデータのリスト [[timestamp, open, high, low, close, volume], ...]
+
+    Returns:
+        列ごとの配列（書き込み不可）
+    """
+    arr = np.asarray(ohlcv, dtype=np.float64).reshape(-1, 6)
+    columns = (arr[:, 0].astype("int64"),) + tuple(arr[:, i] for i in range(1, 6))
+    for column in columns:
+        column.flags.writeable = False
+    return OHLCVArrays(*columns)
 
 
 def _convert_to_kucoin_symbol(symbol: str) -> str:
@@ -57,6 +130,27 @@ def _convert_to_kucoin_symbol(symbol: str) -> str:
     return f"{base}/USDT"
 
 
+# プロバイダーごとのシンボル変換（bitbankはJPY建てのためそのまま）
+SYMBOL_CONVERTERS = {
+    "kucoin": _convert_to_kucoin_symbol,
+    "bitbank": lambda symbol: symbol,
+}
+
+# OHLCVの取得に使うプロバイダー（SYMBOL_CONVERTERSに登録済みのID）
+OHLCV_PROVIDER = "kucoin"
+
+# 時間足表記の単位 → 秒数
+_TIMEFRAME_UNITS = {"m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+# 同一バー内の再取得を省くキャッシュ: (symbol, timeframe, limit) → (バー番号, df)
+_ohlcv_cache: dict[tuple[str, str, int], tuple[int, pd.DataFrame]] = {}
+
+
+def _timeframe_seconds(timeframe: str) -> int:
+    """時間足表記（'1m', '1h', '1d'など）を秒数に変換する。"""
+    return int(timeframe[:-1]) * _TIMEFRAME_UNITS[timeframe[-1]]
+
+
 def fetch_ohlcv_as_df(
     exchange,  # Exchange型だが、bitFlyerでは使わない
     symbol: str,
@@ -78,9 +172,164 @@ def fetch_ohlcv_as_df(
     Returns:
         OHLCVデータのDataFrame
     """
-    kucoin = get_kucoin()
-    kucoin_symbol = _convert_to_kucoin_symbol(symbol)
-    ohlcv = kucoin.fetch_ohlcv(kucoin_symbol, timeframe, limit=limit)
+    provider_symbol = SYMBOL_CONVERTERS[OHLCV_PROVIDER](symbol)
+
+    # 同じバーの間は取得結果が変わらないため、バー番号単位でキャッシュする
+    bucket = int(time.time()) // _timeframe_seconds(timeframe)
+    cache_key = (provider_symbol, timeframe, limit)
+    cached = _ohlcv_cache.get(cache_key)
+    if cached is not None and cached[0] == bucket:
+        logger.debug("OHLCV cache hit: %s %s", provider_symbol, timeframe)
+        # 呼び出し側が列を追加するためコピーを返す
+        return cached[1].copy()
+
+    client = get_client(OHLCV_PROVIDER)
+    ohlcv = client.fetch_ohlcv(provider_symbol, timeframe, limit=limit)
     df = ohlcv_to_dataframe(ohlcv)
-    logger.info(f"Fetched {len(df)} candles for {kucoin_symbol} {timeframe} (via KuCoin)")
-    return df
+    _ohlcv_cache[cache_key] = (bucket, df)
+    logger.info(
+        "Fetched %d candles for %s %s (via %s)",
+        len(df), provider_symbol, timeframe, OHLCV_PROVIDER,
+    )
+    return df.copy()
+
+
+# 同一バー内の再取得を省く配列版キャッシュ（配列は書き込み不可のため
+# DataFrame版と違いコピー不要でそのまま返せる）
+_ohlcv_array_cache: dict[tuple[str, str, int], tuple[int, OHLCVArrays]] = {}
+
+
+def fetch_ohlcv_as_arrays(
+    exchange,  # Exchange型だが、bitFlyerでは使わない
+    symbol: str,
+    timeframe: str = "1h",
+    limit: int = 100,
+) -> OHLCVArrays:
+    """OHLCVデータを取得して列ごとのnumpy配列で返す。
+
+    fetch_ohlcv_as_dfのホットパス版。シグナル判定はfloat64配列しか
+    使わないため、DataFrameの構築もコピーも行わない。バックテストや
+    列追加が必要な呼び出しはDataFrame版を使うこと。
+
+    Args:
+        exchange: Exchangeインスタンス（未使用、互換性のため）
+        symbol: 通貨ペア（例: 'BTC/JPY', 'ETH/JPY'）→ XXX/USDTに変換
+        timeframe: 時間足
+        limit: 取得する本数
+
+    Returns:
+        列ごとの配列（書き込み不可）
+    """
+    provider_symbol = SYMBOL_CONVERTERS[OHLCV_PROVIDER](symbol)
+
+    bucket = int(time.time()) // _timeframe_seconds(timeframe)
+    cache_key = (provider_symbol, timeframe, limit)
+    cached = _ohlcv_array_cache.get(cache_key)
+    if cached is not None and cached[0] == bucket:
+        logger.debug("OHLCV array cache hit: %s %s", provider_symbol, timeframe)
+        return cached[1]
+
+    client = get_client(OHLCV_PROVIDER)
+    ohlcv = client.fetch_ohlcv(provider_symbol, timeframe, limit=limit)
+    arrays = ohlcv_to_arrays(ohlcv)
+    _ohlcv_array_cache[cache_key] = (bucket, arrays)
+    logger.info(
+        "Fetched %d candles for %s %s (via %s)",
+        len(arrays.close), provider_symbol, timeframe, OHLCV_PROVIDER,
+    )
+    return arrays
+
+
+# 複数シンボルの並行取得用スレッドプール（I/O待ちが支配的なため有効）
+_MAX_FETCH_WORKERS = 8
+_fetch_pool: ThreadPoolExecutor | None = None
+
+
+def _get_fetch_pool() -> ThreadPoolExecutor:
+    global _fetch_pool
+    if _fetch_pool is None:
+        _fetch_pool = ThreadPoolExecutor(
+            max_workers=_MAX_FETCH_WORKERS, thread_name_prefix="ohlcv-fetch"
+        )
+    return _fetch_pool
+
+
+def submit_ohlcv_fetch(
+    exchange,
+    symbol: str,
+    timeframe: str = "1h",
+    limit: int = 100,
+):
+    """OHLCV取得をフェッチプールに投入し、Futureを返す。
+
+    呼び出し側は他のリクエスト（残高・価格など）と待ち時間を
+    重ねられる。結果は `future.result()` で受け取る。
+
+    Args:
+        exchange: Exchangeインスタンス（未使用、互換性のため）
+        symbol: 通貨ペア
+        timeframe: 時間足
+        limit: 取得する本数
+
+    Returns:
+        DataFrameを返すFuture
+    """
+    return _get_fetch_pool().submit(
+        fetch_ohlcv_as_df, exchange, symbol, timeframe, limit
+    )
+
+
+def submit_ohlcv_arrays_fetch(
+    exchange,
+    symbol: str,
+    timeframe: str = "1h",
+    limit: int = 100,
+):
+    """配列版のOHLCV取得をフェッチプールに投入し、Futureを返す。
+
+    Args:
+        exchange: Exchangeインスタンス（未使用、互換性のため）
+        symbol: 通貨ペア
+        timeframe: 時間足
+        limit: 取得する本数
+
+    Returns:
+        OHLCVArraysを返すFuture
+    """
+    return _get_fetch_pool().submit(
+        fetch_ohlcv_as_arrays, exchange, symbol, timeframe, limit
+    )
+
+
+def fetch_ohlcv_batch(
+    exchange,
+    symbols: list[str],
+    timeframe: str = "1h",
+    limit: int = 100,
+) -> dict[str, pd.DataFrame]:
+    """複数シンボルのOHLCVを並行して取得する。
+
+    各シンボルの取得はHTTPの往復待ちが支配的なため、スレッドプールで
+    重ねると合計レイテンシはシンボル数に比例せずほぼ1回分に収まる。
+
+    Args:
+        exchange: Exchangeインスタンス（未使用、互換性のため）
+        symbols: 通貨ペアのリスト
+        timeframe: 時間足
+        limit: 取得する本数
+
+    Returns:
+        通貨ペア → OHLCVデータのDataFrame
+    """
+    if len(symbols) <= 1:
+        return {
+            symbol: fetch_ohlcv_as_df(exchange, symbol, timeframe, limit)
+            for symbol in symbols
+        }
+
+    pool = _get_fetch_pool()
+    futures = {
+        symbol: pool.submit(fetch_ohlcv_as_df, exchange, symbol, timeframe, limit)
+        for symbol in symbols
+    }
+    return {symbol: future.result() for symbol, future in futures.items()}
@@ -5,10 +5,14 @@ Supabaseを使用して取引ログを保存する。
 
 from __future__ import annotations
 
+import atexit
+import functools
 import logging
 import os
+import queue
+import threading
+import time
 from datetime import datetime
-from decimal import Decimal
 from typing import TYPE_CHECKING
 
 from supabase import create_client, Client
@@ -20,33 +24,59 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-_client: Client | None = None
-
 
+@functools.lru_cache(maxsize=1)
 def get_supabase_client() -> Client:
     """Supabaseクライアントを取得する（シングルトン）。
 
+    手書きの `global _client` パターンと違い、lru_cacheは
+    C実装かつアトミックなため初回呼び出しの競合が起きない。
+
     Returns:
         Supabaseクライアント
 
     Raises:
         ValueError: 環境変数が設定されていない場合
     """
-    global _client
-    if _client is None:
-        url = os.environ.get("SUPABASE_URL")
-        key = os.environ.get("SUPABASE_KEY")
+    url = os.environ.get("SUPABASE_URL")
+    key = os.environ.get("SUPABASE_KEY")
 
-        if not url or not key:
-            raise ValueError(
-                "SUPABASE_URL and SUPABASE_KEY must be set. "
-                "Get these from your Supabase project settings."
-            )
+    if not url or not key:
+        raise ValueError(
+            "SUPABASE_URL and SUPABASE_KEY must be set. "
+            "Get these from your Supabase project settings."
+        )
 
-        _client = create_client(url, key)
-        logger.info("Supabase client initialized")
+    client = create_client(url, key)
+    logger.info("Supabase client initialized")
+    return client
 
-    return _client
+
+def build_trade_log_row(
+    timestamp: datetime,
+    environment: str,
+    action: str,
+    symbol: str,
+    amount: float,
+    price: float,
+    balance_usdt: float,
+    balance_btc: float,
+    signal: str | None = None,
+    order_id: str | None = None,
+) -> dict:
+    """取引ログ1件分のレコード辞書を構築する。"""
+    return {
+        "timestamp": timestamp.isoformat(),
+        "environment": environment,
+        "action": action,
+        "symbol": symbol,
+        "amount": str(amount),
+        "price": price,
+        "balance_usdt": balance_usdt,
+        "balance_btc": balance_btc,
+        "signal": signal,
+        "order_id": order_id,
+    }
 
 
 def save_trade_log(
@@ -54,13 +84,13 @@ def save_trade_log(
     environment: str,
     action: str,
     symbol: str,
-    amount: Decimal,
+    amount: float,
     price: float,
     balance_usdt: float,
     balance_btc: float,
     signal: str | None = None,
     order_id: str | None = None,
-) -> dict:
+) -> None:
     """取引ログをデータベースに保存する。
 
     Args:
@@ -74,29 +104,109 @@ def save_trade_log(
         balance_btc: 取引後BTC残高
         signal: シグナル種別
         order_id: 注文ID
-
-    Returns:
-        挿入されたレコード
     """
     client = get_supabase_client()
 
-    data = {
-        "timestamp": timestamp.isoformat(),
-        "environment": environment,
-        "action": action,
-        "symbol": symbol,
-        "amount": str(amount),
-        "price": price,
-        "balance_usdt": balance_usdt,
-        "balance_btc": balance_btc,
-        "signal": signal,
-        "order_id": order_id,
-    }
+    data = build_trade_log_row(
+        timestamp=timestamp,
+        environment=environment,
+        action=action,
+        symbol=symbol,
+        amount=amount,
+        price=price,
+        balance_usdt=balance_usdt,
+        balance_btc=balance_btc,
+        signal=signal,
+        order_id=order_id,
+    )
 
-    result = client.table(TRADE_LOGS_TABLE).insert(data).execute()
+    # 戻り値を使う呼び出し元がないため、挿入行のシリアライズ往復を省く
+    client.table(TRADE_LOGS_TABLE).insert(data, returning="minimal").execute()
     logger.info(f"Trade log saved: {action} {amount} {symbol} @ {price}")
 
-    return result.data[0] if result.data else {}
+
+def save_trade_logs(rows: list[dict]) -> None:
+    """複数の取引ログを1回のリクエストでまとめて保存する。
+
+    Args:
+        rows: build_trade_log_rowで構築したレコード辞書のリスト
+    """
+    if not rows:
+        return
+
+    client = get_supabase_client()
+    client.table(TRADE_LOGS_TABLE).insert(rows, returning="minimal").execute()
+    logger.info(f"Trade logs saved: {len(rows)} rows (batch)")
+
+
+# バックグラウンド送信用キュー（enqueue_trade_logで投入し、専用スレッドが
+# まとめてinsertする。取引ループはネットワーク往復を待たない）
+_log_queue: queue.Queue[dict] = queue.Queue()
+_flush_thread: threading.Thread | None = None
+_flush_thread_lock = threading.Lock()
+_FLUSH_WAIT_SECONDS = 0.5
+_FLUSH_BATCH_SIZE = 100
+
+
+def _save_with_fallback(rows: list[dict]) -> None:
+    """バッチ保存し、失敗したら1件ずつ再試行する。"""
+    try:
+        save_trade_logs(rows)
+    except Exception as e:
+        logger.warning(f"Batch save of trade logs failed, retrying per row: {e}")
+        for row in rows:
+            try:
+                save_trade_logs([row])
+            except Exception as e:
+                logger.warning(f"Failed to save trade log: {e}")
+
+
+def _flush_loop() -> None:
+    """キューから取引ログを回収し、バッチでSupabaseへ送信し続ける。"""
+    while True:
+        rows = [_log_queue.get()]
+        # 少し待って同じバッチに相乗りできる行を回収する
+        deadline = time.monotonic() + _FLUSH_WAIT_SECONDS
+        while len(rows) < _FLUSH_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                rows.append(_log_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        _save_with_fallback(rows)
+
+
+def enqueue_trade_log(row: dict) -> None:
+    """取引ログをバックグラウンド送信キューに積む（ノンブロッキング）。
+
+    Args:
+        row: build_trade_log_rowで構築したレコード辞書
+    """
+    global _flush_thread
+    if _flush_thread is None:
+        with _flush_thread_lock:
+            if _flush_thread is None:
+                thread = threading.Thread(
+                    target=_flush_loop, name="trade-log-flush", daemon=True
+                )
+                thread.start()
+                atexit.register(flush_pending_trade_logs)
+                _flush_thread = thread
+    _log_queue.put(row)
+
+
+def flush_pending_trade_logs() -> None:
+    """キューに残っている取引ログを同期的に送信する（プロセス終了時用）。"""
+    rows = []
+    while True:
+        try:
+            rows.append(_log_queue.get_nowait())
+        except queue.Empty:
+            break
+    if rows:
+        _save_with_fallback(rows)
 
 
 def get_trade_logs(
@@ -135,28 +245,47 @@ def get_trade_logs(
 def get_trade_summary(environment: str | None = None) -> dict:
     """取引サマリーを取得する。
 
+    集計はPostgres側で行う（countクエリ）ため、
+    ログ本体を転送してPythonで数え直すことはしない。
+
     Args:
         environment: フィルタする環境
 
     Returns:
         サマリー情報
     """
-    logs = get_trade_logs(environment=environment, limit=1000)
+    client = get_supabase_client()
 
-    if not logs:
+    def _count(action: str | None = None) -> int:
+        """該当する行数だけを取得する（行データは転送しない）。"""
+        query = client.table(TRADE_LOGS_TABLE).select("id", count="exact").limit(1)
+        if environment:
+            query = query.eq("environment", environment)
+        if action:
+            query = query.eq("action", action)
+        return query.execute().count or 0
+
+    def _edge_timestamp(desc: bool) -> str | None:
+        """最古（desc=False）または最新（desc=True）の取引時刻を取得する。"""
+        query = client.table(TRADE_LOGS_TABLE).select("timestamp")
+        if environment:
+            query = query.eq("environment", environment)
+        result = query.order("timestamp", desc=desc).limit(1).execute()
+        return result.data[0]["timestamp"] if result.data else None
+
+    total = _count()
+
+    if total == 0:
         return {
             "total_trades": 0,
             "buy_count": 0,
             "sell_count": 0,
         }
 
-    buy_count = sum(1 for log in logs if log["action"] == "buy")
-    sell_count = sum(1 for log in logs if log["action"] == "sell")
-
     return {
-        "total_trades": len(logs),
-        "buy_count": buy_count,
-        "sell_count": sell_count,
-        "first_trade": logs[-1]["timestamp"] if logs else None,
-        "last_trade": logs[0]["timestamp"] if logs else None,
+        "total_trades": total,
+        "buy_count": _count("buy"),
+        "sell_count": _count("sell"),
+        "first_trade": _edge_timestamp(desc=False),
+        "last_trade": _edge_timestamp(desc=True),
     }
@@ -7,12 +7,19 @@ from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
 import ccxt
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 if TYPE_CHECKING:
     from src.config import Config
 
 logger = logging.getLogger(__name__)
 
+# bitFlyerの最小注文量（APIで取得できない場合のフォールバック）。
+# 毎回の文字列パースを避けるためモジュールロード時にDecimal化しておく
+_MIN_AMOUNT_DEFAULTS = {"BTC": Decimal("0.001"), "ETH": Decimal("0.01")}
+_MIN_AMOUNT_FALLBACK = Decimal("0.01")
+
 
 class Exchange:
     """bitFlyerへの接続を管理するクラス。"""
@@ -28,6 +35,21 @@ class Exchange:
             "secret": api_secret,
             "enableRateLimit": True,
         })
+        # keep-alive + コネクションプールでTLSハンドシェイクを1回に抑える
+        # （並行フェッチ時にコネクションが使い回されるよう余裕を持たせる）
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self.exchange.session.mount("https://", adapter)
+        self.exchange.session.headers["Connection"] = "keep-alive"
+        # シンボルごとの最小注文数量キャッシュ（取引中に変わらない）
+        self._min_amount_cache: dict[str, Decimal] = {}
         logger.warning("bitFlyer connected - Trading with real money!")
 
     @classmethod
@@ -54,7 +76,7 @@ class Exchange:
         balance = self.exchange.fetch_balance()
         jpy = balance.get("JPY", {}).get("free", 0)
         btc = balance.get("BTC", {}).get("free", 0)
-        logger.debug(f"Balance fetched: JPY={jpy}, BTC={btc}")
+        logger.debug("Balance fetched: JPY=%s, BTC=%s", jpy, btc)
         return balance
 
     def fetch_ticker(self, symbol: str) -> dict[str, Any]:
@@ -67,7 +89,7 @@ class Exchange:
             価格情報の辞書
         """
         ticker = self.exchange.fetch_ticker(symbol)
-        logger.debug(f"Ticker {symbol}: {ticker['last']}")
+        logger.debug("Ticker %s: %s", symbol, ticker["last"])
         return ticker
 
     def fetch_ohlcv(
@@ -90,11 +112,11 @@ class Exchange:
         from src.data import get_bitbank
         bitbank = get_bitbank()
         ohlcv = bitbank.fetch_ohlcv(symbol, timeframe, limit=limit)
-        logger.debug(f"OHLCV fetched via bitbank: {symbol} {timeframe} x {len(ohlcv)} candles")
+        logger.debug("OHLCV fetched via bitbank: %s %s x %d candles", symbol, timeframe, len(ohlcv))
         return ohlcv
 
     def create_market_buy_order(
-        self, symbol: str, amount: Decimal
+        self, symbol: str, amount: float
     ) -> dict[str, Any]:
         """成行買い注文を実行する。
 
@@ -105,13 +127,13 @@ class Exchange:
         Returns:
             注文結果
         """
-        logger.info(f"Creating market BUY order: {symbol} amount={amount}")
-        order = self.exchange.create_market_buy_order(symbol, float(amount))
-        logger.info(f"Order executed: id={order['id']} status={order['status']}")
+        logger.info("Creating market BUY order: %s amount=%s", symbol, amount)
+        order = self.exchange.create_market_buy_order(symbol, amount)
+        logger.info("Order executed: id=%s status=%s", order["id"], order["status"])
         return order
 
     def create_market_sell_order(
-        self, symbol: str, amount: Decimal
+        self, symbol: str, amount: float
     ) -> dict[str, Any]:
         """成行売り注文を実行する。
 
@@ -122,9 +144,9 @@ class Exchange:
         Returns:
             注文結果
         """
-        logger.info(f"Creating market SELL order: {symbol} amount={amount}")
-        order = self.exchange.create_market_sell_order(symbol, float(amount))
-        logger.info(f"Order executed: id={order['id']} status={order['status']}")
+        logger.info("Creating market SELL order: %s amount=%s", symbol, amount)
+        order = self.exchange.create_market_sell_order(symbol, amount)
+        logger.info("Order executed: id=%s status=%s", order["id"], order["status"])
         return order
 
     def get_min_order_amount(self, symbol: str) -> Decimal:
@@ -136,13 +158,19 @@ class Exchange:
         Returns:
             最小注文数量
         """
+        cached = self._min_amount_cache.get(symbol)
+        if cached is not None:
+            return cached
+
+        # 初回のみマーケット情報を参照する（load_markets自体もccxtがキャッシュする）
         self.exchange.load_markets()
         market = self.exchange.market(symbol)
         min_amount = market.get("limits", {}).get("amount", {}).get("min", 0)
         if min_amount:
-            return Decimal(str(min_amount))
-        # bitFlyerの最小注文量（APIで取得できない場合のフォールバック）
-        # BTC: 0.001, ETH: 0.01
-        crypto = symbol.split("/")[0]
-        defaults = {"BTC": "0.001", "ETH": "0.01"}
-        return Decimal(defaults.get(crypto, "0.01"))
+            result = Decimal(str(min_amount))
+        else:
+            crypto = symbol.split("/")[0]
+            result = _MIN_AMOUNT_DEFAULTS.get(crypto, _MIN_AMOUNT_FALLBACK)
+
+        self._min_amount_cache[symbol] = result
+        return result
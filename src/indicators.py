@@ -1,9 +1,159 @@
 """テクニカル指標計算モジュール。"""
 
+from typing import Callable, NamedTuple
+
+import numpy as np
 import pandas as pd
 from ta.momentum import RSIIndicator
 from ta.trend import EMAIndicator, SMAIndicator
 
+# 同一データに対する再計算を省くメモ化キャッシュ。
+# バーが更新されると終値のハッシュが変わりキーも変わるため、
+# TTLではなく単純なFIFOの上限だけで十分
+_SERIES_CACHE: dict[tuple, pd.Series] = {}
+_SERIES_CACHE_MAX = 128
+
+
+def _cached_series(
+    kind: str,
+    values: pd.Series,
+    period: int,
+    compute: Callable[[], pd.Series],
+) -> pd.Series:
+    """指標Seriesをデータ内容のハッシュをキーにメモ化する。"""
+    key = (
+        kind,
+        period,
+        len(values),
+        values.index[-1] if len(values) else None,
+        hash(values.to_numpy().tobytes()),
+    )
+    cached = _SERIES_CACHE.get(key)
+    if cached is None:
+        if len(_SERIES_CACHE) >= _SERIES_CACHE_MAX:
+            _SERIES_CACHE.pop(next(iter(_SERIES_CACHE)))
+        cached = compute()
+        _SERIES_CACHE[key] = cached
+    return cached
+
+
+def wilder_rsi_last(close: np.ndarray, period: int = 14) -> float:
+    """終値配列から最終バーのRSI（Wilder平滑）を1パスで計算する。
+
+    diff/where/rollingで中間Seriesを量産するpandas実装と違い、
+    スカラー2つ（平均上昇・平均下降）の逐次更新だけで済む。
+
+    Args:
+        close: 終値のfloat64配列
+        period: RSI計算期間
+
+    Returns:
+        最終バーのRSI値（データがperiod+1本未満の場合はnan）
+    """
+    n = close.shape[0]
+    if n < period + 1:
+        return float("nan")
+
+    # 最初のperiod本の単純平均でシードする
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        d = close[i] - close[i - 1]
+        if d > 0.0:
+            avg_gain += d
+        else:
+            avg_loss -= d
+    avg_gain /= period
+    avg_loss /= period
+
+    # 以降はWilder平滑で末尾まで更新する
+    for i in range(period + 1, n):
+        d = close[i] - close[i - 1]
+        gain = d if d > 0.0 else 0.0
+        loss = -d if d < 0.0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+
+    if avg_loss == 0.0:
+        return 100.0
+    rs = avg_gain / avg_loss
+    return 100.0 - 100.0 / (1.0 + rs)
+
+
+def last_two_sma(close: np.ndarray, period: int) -> tuple[float, float]:
+    """終値配列から直近2本分のSMAだけを計算する。
+
+    クロス判定に必要なのは末尾2本のSMAのみのため、全行のrolling計算を
+    行わず末尾period+1本の平均2回で済ませる（O(N)ではなくO(period)）。
+
+    Args:
+        close: 終値のfloat64配列（period+1本以上あること）
+        period: 移動平均期間
+
+    Returns:
+        (1本前のSMA, 現在のSMA)
+    """
+    tail = close[-(period + 1):]
+    return float(tail[:-1].mean()), float(tail[1:].mean())
+
+
+class IndicatorSnapshot(NamedTuple):
+    """1バー分の売買判定に必要な指標値のまとめ。
+
+    データ不足で計算できない値はnanになる。
+    """
+
+    cur_ma: float  # トレンド判定用MAの現在値
+    prev_ma: float  # lookback本前のトレンド判定用MA
+    short_now: float  # 短期SMAの現在値
+    short_prev: float  # 短期SMAの1本前
+    long_now: float  # 長期SMAの現在値
+    long_prev: float  # 長期SMAの1本前
+    rsi_now: float  # 現在のRSI（Wilder平滑）
+
+
+def compute_indicator_snapshot(
+    close: np.ndarray,
+    trend_period: int = 50,
+    lookback: int = 5,
+    short_period: int = 25,
+    long_period: int = 75,
+    rsi_period: int = 14,
+) -> IndicatorSnapshot:
+    """トレンド判定と各戦略が使う指標値を終値配列から一括計算する。
+
+    check_trendと戦略関数が同じ終値配列を別々に走査していた処理を
+    1ヶ所に融合し、末尾の部分平均とWilder RSIの1パスだけで全値を
+    揃える。中間SeriesもDataFrameコピーも発生しない。
+
+    Args:
+        close: 終値のfloat64配列
+        trend_period: トレンド判定用MAの期間
+        lookback: トレンドMAの傾き判定期間
+        short_period: 短期SMAの期間
+        long_period: 長期SMAの期間
+        rsi_period: RSIの期間
+
+    Returns:
+        指標値のスナップショット
+    """
+
+    def tail_mean(period: int, offset: int = 0) -> float:
+        if close.size < period + offset:
+            return float("nan")
+        end = close.size - offset
+        return float(close[end - period:end].mean())
+
+    return IndicatorSnapshot(
+        cur_ma=tail_mean(trend_period),
+        prev_ma=tail_mean(trend_period, lookback),
+        short_now=tail_mean(short_period),
+        short_prev=tail_mean(short_period, 1),
+        long_now=tail_mean(long_period),
+        long_prev=tail_mean(long_period, 1),
+        rsi_now=wilder_rsi_last(close, rsi_period),
+    )
+
 
 def add_sma(df: pd.DataFrame, period: int, column: str = "close") -> pd.DataFrame:
     """単純移動平均を追加する。
@@ -16,8 +166,11 @@ def add_sma(df: pd.DataFrame, period: int, column: str = "close") -> pd.DataFram
     Returns:
         SMAカラムが追加されたDataFrame
     """
-    sma = SMAIndicator(close=df[column], window=period)
-    df[f"sma_{period}"] = sma.sma_indicator()
+    close = df[column]
+    df[f"sma_{period}"] = _cached_series(
+        "sma", close, period,
+        lambda: SMAIndicator(close=close, window=period).sma_indicator(),
+    )
     return df
 
 
@@ -68,6 +221,9 @@ def add_rsi(df: pd.DataFrame, period: int = 14, column: str = "close") -> pd.Dat
     Returns:
         RSIカラムが追加されたDataFrame
     """
-    rsi = RSIIndicator(close=df[column], window=period)
-    df[f"rsi_{period}"] = rsi.rsi()
+    close = df[column]
+    df[f"rsi_{period}"] = _cached_series(
+        "rsi", close, period,
+        lambda: RSIIndicator(close=close, window=period).rsi(),
+    )
     return df
@@ -1,12 +1,13 @@
 """ポジション管理モジュール。
 
 購入価格を記録し、損切り判定に使用する。
-ローカル実行時はJSONファイル、Vercel実行時はSupabaseに保存。
+ローカル実行時はSQLite、Vercel実行時はSupabaseに保存。
 """
 
 import json
 import logging
 import os
+import sqlite3
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
@@ -14,9 +15,22 @@ from typing import Optional
 
 from src.config import POSITIONS_TABLE
 
+# 関数ごとのインポートはキャッシュ済みでも辞書参照が挟まるため、
+# モジュールロード時に1回だけ解決する（supabase未インストール環境では
+# ローカルSQLiteのみで動作するためNoneにフォールバック）
+try:
+    from src.database import get_supabase_client
+except ImportError:
+    get_supabase_client = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# 旧バージョンのJSONファイル（初回接続時にSQLiteへ移行する）
 POSITION_FILE = Path(__file__).parent.parent / "logs" / "position.json"
+POSITION_DB = Path(__file__).parent.parent / "logs" / "positions.db"
+
+# パスごとの接続キャッシュ（テストはPOSITION_DBを差し替える）
+_connections: dict[Path, sqlite3.Connection] = {}
 
 
 @dataclass
@@ -29,33 +43,103 @@ class Position:
     entry_time: str
 
 
+def _get_db() -> sqlite3.Connection:
+    """ローカルポジションDBへの接続を取得する（パスごとに1つ）。
+
+    WALモードのため書き込みは全ファイル書き換えではなく
+    1行のUPSERTで済み、シンボルごとに独立した行を持てる。
+    """
+    path = POSITION_DB
+    conn = _connections.get(path)
+    if conn is None:
+        path.parent.mkdir(exist_ok=True)
+        conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS positions("
+            "symbol TEXT PRIMARY KEY, "
+            "entry_price REAL, "
+            "amount REAL, "
+            "entry_time TEXT)"
+        )
+        _connections[path] = conn
+        _migrate_json_position(conn, path.with_name(POSITION_FILE.name))
+    return conn
+
+
+def _migrate_json_position(conn: sqlite3.Connection, json_path: Path) -> None:
+    """旧JSONファイルのポジションをSQLiteへ取り込む（1回のみ）。
+
+    json_pathはDBパスから導出した同ディレクトリの旧ファイル。
+    モジュール定数を直接読むと、テストがPOSITION_DBだけを一時パスへ
+    差し替えた場合に本番のlogs/position.jsonを移行・削除してしまう。
+
+    Args:
+        conn: 移行先のDB接続
+        json_path: 旧JSONファイルのパス
+    """
+    if not json_path.exists():
+        return
+    try:
+        with open(json_path) as f:
+            data = json.load(f)
+        position = Position(**data)
+        conn.execute(
+            "INSERT OR REPLACE INTO positions VALUES(?, ?, ?, ?)",
+            (position.symbol, position.entry_price, position.amount,
+             position.entry_time),
+        )
+        json_path.unlink()
+        logger.info(f"Migrated legacy position file to SQLite: {position.symbol}")
+    except (json.JSONDecodeError, TypeError, KeyError) as e:
+        logger.warning(f"Failed to migrate legacy position file: {e}")
+
+
 def save_position_local(position: Position) -> None:
-    """ポジションをローカルファイルに保存する。"""
-    POSITION_FILE.parent.mkdir(exist_ok=True)
-    with open(POSITION_FILE, "w") as f:
-        json.dump(asdict(position), f, indent=2)
+    """ポジションをローカルDBに保存する。"""
+    _get_db().execute(
+        "INSERT INTO positions VALUES(?, ?, ?, ?) "
+        "ON CONFLICT(symbol) DO UPDATE SET "
+        "entry_price=excluded.entry_price, "
+        "amount=excluded.amount, "
+        "entry_time=excluded.entry_time",
+        (position.symbol, position.entry_price, position.amount,
+         position.entry_time),
+    )
     logger.info(f"Position saved: {position.symbol} @ {position.entry_price}")
 
 
 def load_position_local(symbol: str) -> Optional[Position]:
-    """ローカルファイルからポジションを読み込む。"""
-    if not POSITION_FILE.exists():
+    """ローカルDBからポジションを読み込む。"""
+    row = _get_db().execute(
+        "SELECT symbol, entry_price, amount, entry_time "
+        "FROM positions WHERE symbol = ?",
+        (symbol,),
+    ).fetchone()
+    if row is None:
         return None
-    try:
-        with open(POSITION_FILE) as f:
-            data = json.load(f)
-        if data.get("symbol") == symbol:
-            return Position(**data)
-    except (json.JSONDecodeError, KeyError) as e:
-        logger.warning(f"Failed to load position: {e}")
-    return None
+    return Position(*row)
+
+
+def load_all_positions_local() -> dict[str, Position]:
+    """ローカルDBから全ポジションを読み込む。"""
+    rows = _get_db().execute(
+        "SELECT symbol, entry_price, amount, entry_time FROM positions"
+    ).fetchall()
+    return {row[0]: Position(*row) for row in rows}
 
 
-def clear_position_local() -> None:
-    """ローカルのポジション情報を削除する。"""
-    if POSITION_FILE.exists():
-        POSITION_FILE.unlink()
-        logger.info("Position cleared")
+def clear_position_local(symbol: str | None = None) -> None:
+    """ローカルのポジション情報を削除する。
+
+    Args:
+        symbol: 削除する通貨ペア（Noneの場合は全て削除）
+    """
+    if symbol is None:
+        _get_db().execute("DELETE FROM positions")
+    else:
+        _get_db().execute("DELETE FROM positions WHERE symbol = ?", (symbol,))
+    logger.info("Position cleared")
 
 
 def is_supabase_configured() -> bool:
@@ -65,25 +149,18 @@ def is_supabase_configured() -> bool:
 
 def save_position_supabase(position: Position) -> None:
     """ポジションをSupabaseに保存する。"""
-    from supabase import create_client
+    client = get_supabase_client()
 
-    url = os.environ["SUPABASE_URL"]
-    key = os.environ["SUPABASE_KEY"]
-    client = create_client(url, key)
-
-    # 既存のポジションを削除してから保存
-    client.table(POSITIONS_TABLE).delete().eq("symbol", position.symbol).execute()
-    client.table(POSITIONS_TABLE).insert(asdict(position)).execute()
+    # DELETE+INSERTの2往復ではなくUPSERT 1回で置き換える
+    client.table(POSITIONS_TABLE).upsert(
+        asdict(position), on_conflict="symbol"
+    ).execute()
     logger.info(f"Position saved to Supabase: {position.symbol} @ {position.entry_price}")
 
 
 def load_position_supabase(symbol: str) -> Optional[Position]:
     """Supabaseからポジションを読み込む。"""
-    from supabase import create_client
-
-    url = os.environ["SUPABASE_URL"]
-    key = os.environ["SUPABASE_KEY"]
-    client = create_client(url, key)
+    client = get_supabase_client()
 
     # 必要なカラムのみ取得（idは除外）
     result = client.table(POSITIONS_TABLE).select("symbol, entry_price, amount, entry_time").eq("symbol", symbol).execute()
@@ -92,13 +169,21 @@ def load_position_supabase(symbol: str) -> Optional[Position]:
     return None
 
 
+def load_all_positions_supabase() -> dict[str, Position]:
+    """Supabaseから全ポジションを読み込む。"""
+    client = get_supabase_client()
+
+    result = (
+        client.table(POSITIONS_TABLE)
+        .select("symbol, entry_price, amount, entry_time")
+        .execute()
+    )
+    return {row["symbol"]: Position(**row) for row in result.data}
+
+
 def clear_position_supabase(symbol: str) -> None:
     """Supabaseのポジション情報を削除する。"""
-    from supabase import create_client
-
-    url = os.environ["SUPABASE_URL"]
-    key = os.environ["SUPABASE_KEY"]
-    client = create_client(url, key)
+    client = get_supabase_client()
 
     client.table(POSITIONS_TABLE).delete().eq("symbol", symbol).execute()
     logger.info("Position cleared from Supabase")
@@ -133,6 +218,24 @@ def load_position(symbol: str) -> Optional[Position]:
     return load_position_local(symbol)
 
 
+def load_all_positions() -> dict[str, Position]:
+    """全ポジションを1回の読み出しでまとめて取得する。
+
+    シンボルごとにload_positionを繰り返すとストレージ往復がN回に
+    なるため、サイクル先頭で1回読んで各シンボルに使い回す。
+
+    Returns:
+        通貨ペア → ポジション情報
+    """
+    if is_supabase_configured():
+        try:
+            return load_all_positions_supabase()
+        except Exception as e:
+            logger.warning(f"Failed to load from Supabase, using local: {e}")
+            return load_all_positions_local()
+    return load_all_positions_local()
+
+
 def clear_position(symbol: str) -> None:
     """ポジション情報を削除する。"""
     if is_supabase_configured():
@@ -140,33 +243,52 @@ def clear_position(symbol: str) -> None:
             clear_position_supabase(symbol)
         except Exception as e:
             logger.warning(f"Failed to clear from Supabase, using local: {e}")
-            clear_position_local()
+            clear_position_local(symbol)
     else:
-        clear_position_local()
+        clear_position_local(symbol)
 
 
-def check_stop_loss(symbol: str, current_price: float, stop_loss_percent: float) -> bool:
-    """損切り条件をチェックする。
+def should_stop_loss(
+    entry_price: float, current_price: float, stop_loss_percent: float
+) -> bool:
+    """購入価格に対して損切りラインを割ったか判定する（純関数）。
+
+    ストレージへアクセスしないため、一括ロード済みのポジションに
+    対して繰り返し呼んでも往復コストがかからない。
 
     Args:
-        symbol: 通貨ペア
+        entry_price: 購入価格
         current_price: 現在価格
         stop_loss_percent: 損切りパーセンテージ（0.10 = 10%）
 
     Returns:
         損切りすべき場合はTrue
     """
-    position = load_position(symbol)
-    if position is None:
-        return False
-
-    drop_percent = (position.entry_price - current_price) / position.entry_price
+    drop_percent = (entry_price - current_price) / entry_price
 
     if drop_percent >= stop_loss_percent:
         logger.warning(
-            f"STOP LOSS triggered: entry={position.entry_price:.0f}, "
+            f"STOP LOSS triggered: entry={entry_price:.0f}, "
             f"current={current_price:.0f}, drop={drop_percent*100:.1f}%"
         )
         return True
 
     return False
+
+
+def check_stop_loss(symbol: str, current_price: float, stop_loss_percent: float) -> bool:
+    """損切り条件をチェックする。
+
+    Args:
+        symbol: 通貨ペア
+        current_price: 現在価格
+        stop_loss_percent: 損切りパーセンテージ（0.10 = 10%）
+
+    Returns:
+        損切りすべき場合はTrue
+    """
+    position = load_position(symbol)
+    if position is None:
+        return False
+
+    return should_stop_loss(position.entry_price, current_price, stop_loss_percent)
@@ -5,11 +5,16 @@ Supabase Storageを使用して学習データを保存する。
 
 from __future__ import annotations
 
+import functools
 import io
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import httpx
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from src.database import get_supabase_client
 
@@ -18,9 +23,45 @@ logger = logging.getLogger(__name__)
 BUCKET_NAME = "trading-data"
 
 
-def ensure_bucket_exists() -> None:
-    """バケットが存在することを確認し、なければ作成する。"""
+@functools.lru_cache(maxsize=1)
+def _client():
+    """このモジュールで使い回すSupabaseクライアント。
+
+    ストレージのHTTPセッションをHTTP/2対応のhttpx.Clientに差し替え、
+    並行アップロードでもTLSハンドシェイクを増やさず1本の接続に
+    多重化する。
+    """
     client = get_supabase_client()
+    try:
+        storage = client.storage
+        default_session = storage._client
+        storage._client = httpx.Client(
+            base_url=default_session.base_url,
+            headers=default_session.headers,
+            http2=True,
+            timeout=60,
+            limits=httpx.Limits(max_keepalive_connections=16),
+        )
+    except Exception as e:
+        # storage3の内部構造が変わった場合は既定のセッションのまま使う
+        logger.debug(f"HTTP/2 session swap skipped: {e}")
+    return client
+
+
+# 確認済みバケット（プロセス内で1回確認すれば以降のRTTを省ける）
+_verified_buckets: set[str] = set()
+
+
+def ensure_bucket_exists() -> None:
+    """バケットが存在することを確認し、なければ作成する。
+
+    確認は保存のたびに1往復かかるため、プロセス内で一度成功したら
+    以降はスキップする。
+    """
+    if BUCKET_NAME in _verified_buckets:
+        return
+
+    client = _client()
 
     try:
         client.storage.get_bucket(BUCKET_NAME)
@@ -29,6 +70,8 @@ def ensure_bucket_exists() -> None:
         client.storage.create_bucket(BUCKET_NAME, options={"public": False})
         logger.info(f"Bucket '{BUCKET_NAME}' created")
 
+    _verified_buckets.add(BUCKET_NAME)
+
 
 def save_ohlcv_data(
     df: pd.DataFrame,
@@ -46,23 +89,28 @@ def save_ohlcv_data(
         保存したファイルのパス
     """
     ensure_bucket_exists()
-    client = get_supabase_client()
+    client = _client()
 
     # ファイル名を生成
     symbol_safe = symbol.replace("/", "_")
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    file_path = f"ohlcv/{symbol_safe}/{timeframe}/{timestamp}.csv"
-
-    # DataFrameをCSVに変換
-    csv_buffer = io.BytesIO()
-    df.to_csv(csv_buffer, index=True)
-    csv_buffer.seek(0)
+    file_path = f"ohlcv/{symbol_safe}/{timeframe}/{timestamp}.parquet"
+
+    # DataFrameをParquet（zstd圧縮）に変換。
+    # ArrowのBufferOutputStreamに直接書くことで、BytesIO経由の
+    # 再コピー（getvalue()）を1回分省ける
+    sink = pa.BufferOutputStream()
+    pq.write_table(
+        pa.Table.from_pandas(df, preserve_index=True),
+        sink,
+        compression="zstd",
+    )
 
-    # アップロード
+    # アップロード（pa.Bufferはバッファプロトコル対応のためbytes化は1回）
     client.storage.from_(BUCKET_NAME).upload(
         file_path,
-        csv_buffer.getvalue(),
-        {"content-type": "text/csv"},
+        sink.getvalue().to_pybytes(),
+        {"content-type": "application/vnd.apache.parquet"},
     )
 
     logger.info(f"OHLCV data saved: {file_path}")
@@ -78,16 +126,50 @@ def load_ohlcv_data(file_path: str) -> pd.DataFrame:
     Returns:
         OHLCVデータのDataFrame
     """
-    client = get_supabase_client()
+    client = _client()
 
     response = client.storage.from_(BUCKET_NAME).download(file_path)
 
-    df = pd.read_csv(io.BytesIO(response), index_col=0, parse_dates=True)
+    if file_path.endswith(".csv"):
+        # Parquet移行前に保存された旧ファイル
+        df = pd.read_csv(io.BytesIO(response), index_col=0, parse_dates=True)
+    else:
+        df = pd.read_parquet(io.BytesIO(response), engine="pyarrow")
     logger.info(f"OHLCV data loaded: {file_path} ({len(df)} rows)")
 
     return df
 
 
+# 複数ファイルの並行ダウンロード用ワーカー数（I/O待ちが支配的なため有効）
+_MAX_DOWNLOAD_WORKERS = 8
+
+
+def load_ohlcv_batch(file_paths: list[str]) -> dict[str, pd.DataFrame]:
+    """複数のOHLCVファイルをStorageから並行して読み込む。
+
+    各ダウンロードはHTTPの往復待ちが支配的なため、スレッドプールで
+    重ねると合計レイテンシはファイル数に比例せずほぼ1回分に収まる。
+    CSVのパースも各ワーカー内で行われるため、パースと通信が重なる。
+
+    Args:
+        file_paths: ファイルパスのリスト
+
+    Returns:
+        ファイルパス → OHLCVデータのDataFrame
+    """
+    if len(file_paths) <= 1:
+        return {path: load_ohlcv_data(path) for path in file_paths}
+
+    workers = min(_MAX_DOWNLOAD_WORKERS, len(file_paths))
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="storage-dl"
+    ) as pool:
+        futures = {
+            path: pool.submit(load_ohlcv_data, path) for path in file_paths
+        }
+        return {path: future.result() for path, future in futures.items()}
+
+
 def list_ohlcv_files(
     symbol: str | None = None,
     timeframe: str | None = None,
@@ -101,7 +183,7 @@ def list_ohlcv_files(
     Returns:
         ファイル情報のリスト
     """
-    client = get_supabase_client()
+    client = _client()
 
     # パスを構築
     path = "ohlcv"
@@ -135,7 +217,7 @@ def save_model(
         保存したファイルのパス
     """
     ensure_bucket_exists()
-    client = get_supabase_client()
+    client = _client()
 
     if version is None:
         version = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -161,7 +243,7 @@ def load_model(file_path: str) -> bytes:
     Returns:
         モデルのバイナリデータ
     """
-    client = get_supabase_client()
+    client = _client()
 
     response = client.storage.from_(BUCKET_NAME).download(file_path)
     logger.info(f"Model loaded: {file_path}")
@@ -175,6 +257,6 @@ def delete_file(file_path: str) -> None:
     Args:
         file_path: ファイルパス
     """
-    client = get_supabase_client()
+    client = _client()
     client.storage.from_(BUCKET_NAME).remove([file_path])
     logger.info(f"File deleted: {file_path}")
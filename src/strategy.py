@@ -1,11 +1,13 @@
 """売買戦略モジュール。"""
 
 import logging
+import math
 from enum import Enum
 
+import numpy as np
 import pandas as pd
 
-from src.indicators import add_moving_averages, add_rsi
+from src.indicators import last_two_sma, wilder_rsi_last
 
 logger = logging.getLogger(__name__)
 
@@ -37,28 +39,25 @@ def ma_crossover_signal(
     Returns:
         売買シグナル
     """
-    df = add_moving_averages(df, short_period, long_period)
-
-    short_col = f"sma_{short_period}"
-    long_col = f"sma_{long_period}"
+    closes = df["close"].to_numpy(dtype=np.float64, copy=False)
 
     # 直近のデータが不足している場合
-    if df[short_col].isna().iloc[-1] or df[long_col].isna().iloc[-1]:
+    if closes.size < long_period + 1:
         logger.warning("Not enough data for MA calculation")
         return Signal.HOLD
 
-    # MA計算の詳細ログ
-    logger.info(f"=== MA計算開始 (短期: {short_period}, 長期: {long_period}) ===")
-
-    # 現在と1本前のクロス状態を確認
-    current_short = df[short_col].iloc[-1]
-    current_long = df[long_col].iloc[-1]
-    prev_short = df[short_col].iloc[-2]
-    prev_long = df[long_col].iloc[-2]
+    # クロス判定に必要な末尾2本分のSMAだけを計算する
+    # （全行のrolling計算もカラム追加のためのコピーも不要）
+    prev_short, current_short = last_two_sma(closes, short_period)
+    prev_long, current_long = last_two_sma(closes, long_period)
 
-    logger.info(f"現在: 短期MA={current_short:.2f}, 長期MA={current_long:.2f}")
-    logger.info(f"1本前: 短期MA={prev_short:.2f}, 長期MA={prev_long:.2f}")
-    logger.info(f"ポジション: {'あり' if has_position else 'なし'}")
+    # MA計算の詳細ログ（INFO無効時はf-stringの構築ごとスキップする）
+    verbose = logger.isEnabledFor(logging.INFO)
+    if verbose:
+        logger.info(f"=== MA計算開始 (短期: {short_period}, 長期: {long_period}) ===")
+        logger.info(f"現在: 短期MA={current_short:.2f}, 長期MA={current_long:.2f}")
+        logger.info(f"1本前: 短期MA={prev_short:.2f}, 長期MA={prev_long:.2f}")
+        logger.info(f"ポジション: {'あり' if has_position else 'なし'}")
 
     signal = Signal.HOLD
     reason = ""
@@ -72,24 +71,27 @@ def ma_crossover_signal(
         # ポジションあり → 売りシグナルのみ判定
         if dead_cross:
             signal = Signal.SELL
-            reason = f"デッドクロス検出（短期{current_short:.2f} < 長期{current_long:.2f}）→ 売りシグナル"
+            if verbose:
+                reason = f"デッドクロス検出（短期{current_short:.2f} < 長期{current_long:.2f}）→ 売りシグナル"
         elif current_short < current_long:
             # トレンド転換の可能性（まだクロスしていないがMAが接近）
-            reason = f"短期MA < 長期MA、売り待機（クロス待ち）"
+            reason = "短期MA < 長期MA、売り待機（クロス待ち）"
         else:
-            reason = f"短期MA > 長期MA、上昇トレンド継続、ホールド"
+            reason = "短期MA > 長期MA、上昇トレンド継続、ホールド"
     else:
         # ポジションなし → 買いシグナルのみ判定
         if golden_cross:
             signal = Signal.BUY
-            reason = f"ゴールデンクロス検出（短期{current_short:.2f} > 長期{current_long:.2f}）→ 買いシグナル"
+            if verbose:
+                reason = f"ゴールデンクロス検出（短期{current_short:.2f} > 長期{current_long:.2f}）→ 買いシグナル"
         elif current_short > current_long:
-            reason = f"短期MA > 長期MA、上昇トレンド中だがエントリー待ち（クロス待ち）"
+            reason = "短期MA > 長期MA、上昇トレンド中だがエントリー待ち（クロス待ち）"
         else:
-            reason = f"短期MA < 長期MA、下降トレンド、買い控え"
+            reason = "短期MA < 長期MA、下降トレンド、買い控え"
 
-    logger.info(f"判定: {reason}")
-    logger.info(f"=== 結果: {signal.value.upper()} ===")
+    if verbose:
+        logger.info(f"判定: {reason}")
+        logger.info(f"=== 結果: {signal.value.upper()} ===")
 
     return signal
 
@@ -115,53 +117,37 @@ def rsi_contrarian_signal(
     Returns:
         売買シグナル
     """
-    df = df.copy()
-    closes = df["close"]
-
-    # RSI計算の詳細ログ
-    logger.info(f"=== RSI計算開始 (期間: {period}) ===")
-
-    # 直近の価格変動を表示
-    recent_prices = closes.tail(period + 1)
-    logger.info(f"直近{period + 1}本の終値: {[f'{p:.2f}' for p in recent_prices.values]}")
-
-    # 価格変動を計算
-    deltas = closes.diff()
-    gains = deltas.where(deltas > 0, 0.0)
-    losses = (-deltas).where(deltas < 0, 0.0)
-
-    # 直近periodの上昇/下降
-    recent_gains = gains.tail(period)
-    recent_losses = losses.tail(period)
-
-    gain_count = (recent_gains > 0).sum()
-    loss_count = (recent_losses > 0).sum()
-    total_gain = recent_gains.sum()
-    total_loss = recent_losses.sum()
-
-    logger.info(f"直近{period}本: 上昇{gain_count}回(計{total_gain:.2f}), 下降{loss_count}回(計{total_loss:.2f})")
-
-    # 平均上昇/下降
-    avg_gain = gains.rolling(window=period, min_periods=period).mean()
-    avg_loss = losses.rolling(window=period, min_periods=period).mean()
-
-    current_avg_gain = avg_gain.iloc[-1]
-    current_avg_loss = avg_loss.iloc[-1]
-
-    # RSI計算
-    if pd.isna(current_avg_gain) or pd.isna(current_avg_loss):
+    # 読み取り専用のためコピー不要（RSIは終値のnumpyビューから直接計算する）
+    closes = df["close"].to_numpy(dtype=np.float64, copy=False)
+
+    # RSI計算の詳細ログ（INFO無効時は終値リストの整形ごとスキップする）
+    verbose = logger.isEnabledFor(logging.INFO)
+    if verbose:
+        logger.info(f"=== RSI計算開始 (期間: {period}) ===")
+
+        # 直近の価格変動を表示
+        recent_prices = closes[-(period + 1):]
+        logger.info(f"直近{period + 1}本の終値: {[f'{p:.2f}' for p in recent_prices]}")
+
+        # 直近periodの上昇/下降
+        recent_deltas = np.diff(recent_prices)
+        recent_gains = recent_deltas[recent_deltas > 0]
+        recent_losses = -recent_deltas[recent_deltas < 0]
+
+        logger.info(
+            f"直近{period}本: 上昇{recent_gains.size}回(計{recent_gains.sum():.2f}), "
+            f"下降{recent_losses.size}回(計{recent_losses.sum():.2f})"
+        )
+
+    # RSI計算（Wilder平滑の1パス実装、中間Seriesを作らない）
+    current_rsi = wilder_rsi_last(closes, period)
+    if math.isnan(current_rsi):
         logger.warning("Not enough data for RSI calculation")
         return Signal.HOLD
 
-    if current_avg_loss == 0:
-        current_rsi = 100.0
-    else:
-        rs = current_avg_gain / current_avg_loss
-        current_rsi = 100 - (100 / (1 + rs))
-
-    logger.info(f"平均上昇: {current_avg_gain:.4f}, 平均下降: {current_avg_loss:.4f}")
-    logger.info(f"RSI = {current_rsi:.2f} (売られすぎ: <{oversold}, 買われすぎ: >{overbought})")
-    logger.info(f"ポジション: {'あり' if has_position else 'なし'}")
+    if verbose:
+        logger.info(f"RSI = {current_rsi:.2f} (売られすぎ: <{oversold}, 買われすぎ: >{overbought})")
+        logger.info(f"ポジション: {'あり' if has_position else 'なし'}")
 
     # シグナル判定
     signal = Signal.HOLD
@@ -180,7 +166,8 @@ def rsi_contrarian_signal(
         else:
             reason = f"RSI({current_rsi:.1f}) >= {oversold} → まだ買い時ではない、ホールド"
 
-    logger.info(f"判定: {reason}")
-    logger.info(f"=== 結果: {signal.value.upper()} ===")
+    if verbose:
+        logger.info(f"判定: {reason}")
+        logger.info(f"=== 結果: {signal.value.upper()} ===")
 
     return signal
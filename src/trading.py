@@ -3,22 +3,70 @@
 bot.py（ローカル実行）とapi/trade.py（Vercel Cron）で共有する。
 """
 
+import functools
 import logging
+import math
 import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
-from decimal import Decimal, ROUND_DOWN
+from decimal import Decimal
 from typing import Optional
 
 from src.config import Config, Strategy, SymbolConfig
-from src.data import fetch_ohlcv_as_df
+from src.data import OHLCVArrays, submit_ohlcv_arrays_fetch
+from src.indicators import compute_indicator_snapshot
 from src.exchange import Exchange
-from src.position import check_stop_loss, clear_position, load_position, save_position
+from src.position import (
+    Position,
+    check_stop_loss,
+    clear_position,
+    load_all_positions,
+    load_position,
+    save_position,
+    should_stop_loss,
+)
 from src.strategy import Signal, ma_crossover_signal, rsi_contrarian_signal
 
 logger = logging.getLogger(__name__)
 
 
+# process_symbol内の各処理の所要時間をサイクル単位で累積する
+# （bot.pyがサイクル末尾でlog_cycle_timings()を呼んで出力・リセットする）
+cycle_timings: defaultdict[str, float] = defaultdict(float)
+
+
+@contextmanager
+def _timed(name: str, sink: dict[str, float] = cycle_timings):
+    """ブロックの実時間を計測してsinkに加算するコンテキストマネージャ。"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        sink[name] += time.perf_counter() - start
+
+
+def log_cycle_timings() -> None:
+    """サイクル内の計測値を1行にまとめてログ出力し、リセットする。"""
+    if not cycle_timings:
+        return
+    summary = ", ".join(
+        f"{name}={seconds * 1000:.0f}ms"
+        for name, seconds in sorted(cycle_timings.items())
+    )
+    logger.info("Cycle timings: %s", summary)
+    cycle_timings.clear()
+
+
+# bitFlyer JPY建てペアのテイカー手数料。注文後に残高をAPIで取り直さず、
+# 約定数量と現在価格からresultの残高を算術更新するために使う
+TAKER_FEE = 0.0015
+
+
 class Trend:
     """トレンド状態。"""
 
@@ -27,7 +75,7 @@ class Trend:
     SIDEWAYS = "sideways"  # 横ばい
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeResult:
     """取引結果。"""
 
@@ -39,17 +87,28 @@ class TradeResult:
     balance_crypto: float
     has_position: bool
     action: str = "none"
-    amount: Optional[Decimal] = None
+    amount: Optional[float] = None
     order_id: Optional[str] = None
     error: Optional[str] = None
     trend: Optional[str] = None  # トレンド状態
 
 
+def _free(balance: dict, currency: str) -> float:
+    """残高辞書から利用可能残高を取り出す。
+
+    `.get(key, {}).get("free", 0)` の連鎖は呼び出しごとに空辞書を
+    割り当てるため、1回の参照と条件分岐に置き換える。
+    """
+    sub = balance.get(currency)
+    return float(sub["free"]) if sub and sub.get("free") is not None else 0.0
+
+
 def is_supabase_configured() -> bool:
     """Supabaseが設定されているか確認する。"""
     return bool(os.environ.get("SUPABASE_URL") and os.environ.get("SUPABASE_KEY"))
 
 
+@functools.lru_cache(maxsize=32)
 def get_crypto_currency(symbol: str) -> str:
     """シンボルから暗号通貨部分を取得する。
 
@@ -62,6 +121,7 @@ def get_crypto_currency(symbol: str) -> str:
     return symbol.split("/")[0]
 
 
+@functools.lru_cache(maxsize=32)
 def get_order_unit(symbol: str) -> Decimal:
     """通貨ペアの注文単位を取得する。
 
@@ -76,6 +136,18 @@ def get_order_unit(symbol: str) -> Decimal:
     return units.get(crypto, Decimal("0.01"))
 
 
+# 注文単位あたりのティック数（0.001 → 1000）。数量の切り捨ては
+# _floor_to_ticksで10進数経由の正確な積に対して行う
+_TICKS_PER_UNIT = {"BTC": 1000, "ETH": 100}
+
+
+@functools.lru_cache(maxsize=32)
+def get_tick_count(symbol: str) -> int:
+    """注文単位あたりのティック数を取得する（例: BTCは0.001単位 → 1000）。"""
+    return _TICKS_PER_UNIT.get(symbol.split("/")[0], 100)
+
+
+@functools.lru_cache(maxsize=32)
 def get_min_balance(symbol: str) -> float:
     """通貨ペアの最小残高を取得する。"""
     crypto = get_crypto_currency(symbol)
@@ -84,7 +156,30 @@ def get_min_balance(symbol: str) -> float:
     return 0.01  # ETHなど
 
 
-def check_trend(df, ma_period: int = 50, lookback: int = 5) -> str:
+def _floor_to_ticks(value: float, ticks: int) -> float:
+    """数量をティック（注文単位）に切り捨てる。
+
+    float積のままfloorすると 0.29 * 100 → 28.999… のような2進誤差で
+    1ティック過小になるため、10進文字列経由の正確な積で切り捨てる。
+
+    Args:
+        value: 切り捨てる数量
+        ticks: 注文単位あたりのティック数
+
+    Returns:
+        ティック単位に切り捨てた数量
+    """
+    return int(Decimal(str(value)) * ticks) / ticks
+
+
+# 同一バー内のトレンド再計算を省くキャッシュ（_signal_cacheと同方式）
+_trend_cache: dict[tuple, str] = {}
+_TREND_CACHE_MAX = 64
+
+
+def check_trend(
+    df, ma_period: int = 50, lookback: int = 5, symbol: Optional[str] = None
+) -> str:
     """トレンドを判定する。
 
     判定ロジック:
@@ -96,20 +191,30 @@ def check_trend(df, ma_period: int = 50, lookback: int = 5) -> str:
         df: OHLCVデータ
         ma_period: 移動平均期間
         lookback: MA傾き判定の期間
+        symbol: キャッシュキーに使う通貨ペア（Noneの場合はキャッシュしない）
 
     Returns:
         トレンド状態
     """
-    df = df.copy()
-    df[f"ma{ma_period}"] = df["close"].rolling(ma_period).mean()
-
     if len(df) < ma_period + lookback:
         logger.warning("Not enough data for trend check")
         return Trend.SIDEWAYS
 
-    current_price = df["close"].iloc[-1]
-    current_ma = df[f"ma{ma_period}"].iloc[-1]
-    prev_ma = df[f"ma{ma_period}"].iloc[-1 - lookback]
+    # バーが進んでいなければ前回の判定を使い回す
+    key = None
+    if symbol is not None:
+        key = (symbol, int(df["timestamp"].iloc[-1]), ma_period, lookback)
+        cached = _trend_cache.get(key)
+        if cached is not None:
+            logger.debug("Trend cache hit: %s", symbol)
+            return cached
+
+    # 判定に使うのは現在とlookback本前のMAの2点だけなので、
+    # DataFrameのコピーも全行のrolling計算も行わず部分平均で求める
+    close = df["close"].to_numpy(dtype="float64", copy=False)
+    current_price = close[-1]
+    current_ma = close[-ma_period:].mean()
+    prev_ma = close[-ma_period - lookback:-lookback].mean()
 
     price_above_ma = current_price > current_ma
     ma_rising = current_ma > prev_ma
@@ -122,43 +227,197 @@ def check_trend(df, ma_period: int = 50, lookback: int = 5) -> str:
         trend = Trend.SIDEWAYS
 
     logger.info(
-        f"Trend: {trend} (price={current_price:.0f}, "
-        f"MA{ma_period}={current_ma:.0f}, rising={ma_rising})"
+        "Trend: %s (price=%.0f, MA%d=%.0f, rising=%s)",
+        trend, current_price, ma_period, current_ma, ma_rising,
     )
 
+    if key is not None:
+        if len(_trend_cache) >= _TREND_CACHE_MAX:
+            _trend_cache.pop(next(iter(_trend_cache)))
+        _trend_cache[key] = trend
+
     return trend
 
 
+def _rsi_dispatch(df, symbol_config: SymbolConfig, has_position: bool) -> Signal:
+    """RSI逆張り戦略をシンボル設定のパラメータで呼び出す。"""
+    return rsi_contrarian_signal(
+        df,
+        period=symbol_config.rsi_period,
+        oversold=symbol_config.rsi_oversold,
+        overbought=symbol_config.rsi_overbought,
+        has_position=has_position,
+    )
+
+
+def _ma_dispatch(df, symbol_config: SymbolConfig, has_position: bool) -> Signal:
+    """MAクロスオーバー戦略をシンボル設定のパラメータで呼び出す。"""
+    return ma_crossover_signal(
+        df,
+        short_period=symbol_config.ma_short_period,
+        long_period=symbol_config.ma_long_period,
+        has_position=has_position,
+    )
+
+
+# 戦略 → シグナル関数のディスパッチテーブル（毎サイクルのif/elif判定を回避。
+# 戦略を追加する場合はここに登録するだけでよい）
+_STRATEGY_DISPATCH = {
+    Strategy.RSI_CONTRARIAN: _rsi_dispatch,
+    Strategy.MA_CROSSOVER: _ma_dispatch,
+}
+
+
+# check_trend（MA50 + lookback 5）が要求する最低本数
+_TREND_BARS = 50 + 5 + 1
+
+
+def required_bars(symbol_config: SymbolConfig) -> int:
+    """戦略とトレンド判定に必要なOHLCV本数を計算する。
+
+    無条件にlimit=100を取ると転送・パース量が無駄になるため、
+    使用する指標の期間＋1本分の余裕だけを要求する。
+
+    Args:
+        symbol_config: 通貨ペアごとの設定
+
+    Returns:
+        fetch_ohlcvに渡す本数
+    """
+    if symbol_config.strategy is Strategy.MA_CROSSOVER:
+        needed = symbol_config.ma_long_period + 2
+    else:
+        needed = symbol_config.rsi_period + 2
+    return max(needed, _TREND_BARS)
+
+
 def get_signal_for_symbol(
     df,
     symbol_config: SymbolConfig,
     has_position: bool,
 ) -> Signal:
     """シンボル設定に応じた戦略でシグナルを生成する。"""
-    if symbol_config.strategy == Strategy.RSI_CONTRARIAN:
-        return rsi_contrarian_signal(
-            df,
-            period=symbol_config.rsi_period,
-            oversold=symbol_config.rsi_oversold,
-            overbought=symbol_config.rsi_overbought,
-            has_position=has_position,
-        )
-    elif symbol_config.strategy == Strategy.MA_CROSSOVER:
-        return ma_crossover_signal(
-            df,
-            short_period=symbol_config.ma_short_period,
-            long_period=symbol_config.ma_long_period,
-            has_position=has_position,
-        )
-    else:
-        logger.warning(f"Unknown strategy: {symbol_config.strategy}")
+    signal_fn = _STRATEGY_DISPATCH.get(symbol_config.strategy)
+    if signal_fn is None:
+        logger.warning("Unknown strategy: %s", symbol_config.strategy)
         return Signal.HOLD
+    return signal_fn(df, symbol_config, has_position)
+
+
+class _JpyBudget:
+    """サイクル内の買い注文で共有するJPY残高の予算カウンター。
+
+    残高スナップショットを複数ワーカーで共有すると、各シンボルが同じ
+    残高を基準に買い額を組み、サイクル合計がスナップショットを超えて
+    後続の注文が拒否され得る。発注前に使う分を原子的に引き当てることで
+    合計をスナップショット以内に抑える。
+    """
+
+    def __init__(self, total: float) -> None:
+        self._remaining = total
+        self._lock = threading.Lock()
+
+    def reserve(self, desired: float) -> float:
+        """desiredと残額の小さい方を確保して返す（残額がなければ0）。"""
+        with self._lock:
+            granted = min(desired, self._remaining)
+            if granted > 0.0:
+                self._remaining -= granted
+            return granted
+
+    def release(self, amount: float) -> None:
+        """確保したが使わなかった額を残額へ戻す。"""
+        if amount <= 0.0:
+            return
+        with self._lock:
+            self._remaining += amount
+
+
+# 同一バー内のトレンド・シグナル再計算を省くキャッシュ。
+# キー: (symbol, timeframe, 最終バーのタイムスタンプ, 戦略, ポジション有無)。
+# バーが進むとキーが変わるためTTLは不要、FIFOの上限のみ設ける
+_bar_state_cache: dict[tuple, tuple[str, Signal]] = {}
+_BAR_STATE_CACHE_MAX = 256
+
+
+def _evaluate_bar(
+    ohlcv: OHLCVArrays,
+    timeframe: str,
+    symbol_config: SymbolConfig,
+    has_position: bool,
+) -> tuple[str, Signal]:
+    """トレンドとシグナルを終値配列の一括走査で判定する。
+
+    check_trendと戦略関数は同じ終値を別々に走査するため、ホットパス
+    ではcompute_indicator_snapshotで必要な指標値を融合計算し、閾値
+    判定だけをPython側で行う（詳細な計算ログが必要な場合は
+    strategy.pyの関数を直接呼ぶ）。結果はバー単位でキャッシュされ、
+    Cronが時間足より細かく起動しても再計算しない。
+    """
+    key = (
+        symbol_config.symbol,
+        timeframe,
+        int(ohlcv.timestamp[-1]),
+        symbol_config.strategy,
+        has_position,
+    )
+    cached = _bar_state_cache.get(key)
+    if cached is not None:
+        logger.debug("Bar state cache hit: %s %s", symbol_config.symbol, timeframe)
+        return cached
+
+    close = ohlcv.close
+    snap = compute_indicator_snapshot(
+        close,
+        short_period=symbol_config.ma_short_period,
+        long_period=symbol_config.ma_long_period,
+        rsi_period=symbol_config.rsi_period,
+    )
+
+    # トレンド判定（check_trendと同じロジック）
+    if math.isnan(snap.prev_ma):
+        trend = Trend.SIDEWAYS
+    else:
+        price_above_ma = close[-1] > snap.cur_ma
+        ma_rising = snap.cur_ma > snap.prev_ma
+        if price_above_ma and ma_rising:
+            trend = Trend.UPTREND
+        elif not price_above_ma and not ma_rising:
+            trend = Trend.DOWNTREND
+        else:
+            trend = Trend.SIDEWAYS
+
+    # シグナル判定（strategy.pyの各関数と同じ閾値）
+    signal = Signal.HOLD
+    if symbol_config.strategy is Strategy.MA_CROSSOVER:
+        if not math.isnan(snap.long_prev):
+            if has_position:
+                if snap.short_prev >= snap.long_prev and snap.short_now < snap.long_now:
+                    signal = Signal.SELL
+            elif snap.short_prev <= snap.long_prev and snap.short_now > snap.long_now:
+                signal = Signal.BUY
+    elif symbol_config.strategy is Strategy.RSI_CONTRARIAN:
+        if not math.isnan(snap.rsi_now):
+            if has_position:
+                if snap.rsi_now > symbol_config.rsi_overbought:
+                    signal = Signal.SELL
+            elif snap.rsi_now < symbol_config.rsi_oversold:
+                signal = Signal.BUY
+
+    state = (trend, signal)
+    if len(_bar_state_cache) >= _BAR_STATE_CACHE_MAX:
+        _bar_state_cache.pop(next(iter(_bar_state_cache)))
+    _bar_state_cache[key] = state
+    return state
 
 
 def process_symbol(
     exchange: Exchange,
     config: Config,
     symbol_config: SymbolConfig,
+    positions: Optional[dict[str, Position]] = None,
+    balance: Optional[dict] = None,
+    jpy_budget: Optional[_JpyBudget] = None,
 ) -> TradeResult:
     """1つの通貨ペアの取引処理を行い、結果を返す。
 
@@ -166,46 +425,78 @@ def process_symbol(
         exchange: 取引所インスタンス
         config: 設定
         symbol_config: 通貨ペアごとの設定
+        positions: 事前に一括ロードしたポジション（load_all_positions()の
+            結果）。指定するとシンボルごとのストレージ往復を省ける
+        balance: 事前に取得した残高（fetch_balance()の結果）。残高は
+            ウォレット全体のスナップショットなので、複数シンボルで
+            1回分を共有するとREST往復をN→1に減らせる
+        jpy_budget: 共有スナップショットで並行して買う場合のJPY予算
+            カウンター。サイクル内の買い合計が残高を超えないように
+            発注前に引き当てる
 
     Returns:
         取引結果
     """
     symbol = symbol_config.symbol
-    crypto = get_crypto_currency(symbol)
-
-    # データ取得
-    df = fetch_ohlcv_as_df(exchange, symbol, config.timeframe, limit=100)
-
-    # 残高確認
-    balance = exchange.fetch_balance()
-    jpy_balance = float(balance.get("JPY", {}).get("free", 0))
-    crypto_balance = float(balance.get(crypto, {}).get("free", 0))
+    crypto = symbol_config.crypto
+    min_balance = symbol_config.min_balance
 
-    ticker = exchange.fetch_ticker(symbol)
-    current_price = ticker["last"]
-
-    # 最小取引量
-    min_balance = get_min_balance(symbol)
+    # 残高確認（呼び出し元から渡されていなければここで取得）
+    if balance is None:
+        with _timed("fetch_balance"):
+            balance = exchange.fetch_balance()
+    jpy_balance = _free(balance, "JPY")
+    crypto_balance = _free(balance, crypto)
 
     # ポジション保有状態を確認（実残高ベースで判定）
     # ※ポジションデータ（Supabase）は購入価格の記録として損切り計算にのみ使用
     has_position = crypto_balance > min_balance
 
-    # トレンド判定（MA50ベース）
-    trend = check_trend(df, ma_period=50, lookback=5)
+    # 買う資金も売る残高もない場合はどの分岐も成立しない（損切りも
+    # 実残高が前提）ため、OHLCV・価格取得と指標計算を丸ごと省く
+    if jpy_balance <= 1000 and not has_position:
+        logger.info("[%s] Skipped: no actionable balance", symbol)
+        return TradeResult(
+            symbol=symbol,
+            strategy=symbol_config.strategy.value,
+            signal=Signal.HOLD.value,
+            price=0.0,
+            balance_jpy=jpy_balance,
+            balance_crypto=crypto_balance,
+            has_position=has_position,
+        )
 
-    # 戦略に応じたシグナル生成
-    signal = get_signal_for_symbol(df, symbol_config, has_position)
-    logger.info(f"[{symbol}] Signal: {signal.value}, Trend: {trend}")
+    # データ取得。OHLCV（KuCoin）とbitFlyerへの価格取得は別ホストの
+    # ため、OHLCVをバックグラウンドで走らせて待ち時間を重ねる。
+    # シグナル判定は終値配列しか使わないためDataFrameを構築しない
+    ohlcv_future = submit_ohlcv_arrays_fetch(
+        exchange, symbol, config.timeframe, limit=required_bars(symbol_config)
+    )
+
+    with _timed("fetch_ticker"):
+        ticker = exchange.fetch_ticker(symbol)
+    current_price = ticker["last"]
+
+    # 残り時間だけ待つ（既に完了していれば即座に返る）
+    with _timed("fetch_ohlcv"):
+        ohlcv = ohlcv_future.result()
+
+    # トレンド判定（MA50ベース）とシグナル生成を一括で行う
+    # （同一バー内はキャッシュを再利用）
+    with _timed("indicators"):
+        trend, signal = _evaluate_bar(
+            ohlcv, config.timeframe, symbol_config, has_position
+        )
+    logger.info("[%s] Signal: %s, Trend: %s", symbol, signal.value, trend)
 
     # RSI逆張り戦略の場合のみ、下降トレンドで買いシグナルをスキップ
     # （順張りMAクロスオーバーは自身でトレンドを判断しているためフィルター不要）
     if (
-        symbol_config.strategy == Strategy.RSI_CONTRARIAN
-        and signal == Signal.BUY
+        symbol_config.strategy is Strategy.RSI_CONTRARIAN
+        and signal is Signal.BUY
         and trend == Trend.DOWNTREND
     ):
-        logger.warning(f"[{symbol}] Buy signal skipped due to downtrend (RSI contrarian)")
+        logger.warning("[%s] Buy signal skipped due to downtrend (RSI contrarian)", symbol)
         signal = Signal.HOLD
 
     result = TradeResult(
@@ -219,65 +510,164 @@ def process_symbol(
         trend=trend,
     )
 
-    order_unit = get_order_unit(symbol)
-
-    # 損切りチェック（シグナルより優先）
-    if crypto_balance > min_balance and check_stop_loss(
-        symbol, current_price, symbol_config.stop_loss_percent
-    ):
-        amount = Decimal(str(crypto_balance)).quantize(order_unit, rounding=ROUND_DOWN)
-        order = exchange.create_market_sell_order(symbol, float(amount))
-        balance = exchange.fetch_balance()
+    ticks = symbol_config.tick_count
+
+    # 損切りチェック（シグナルより優先）。一括ロード済みのポジションが
+    # あればそれを使い、シンボルごとのストレージ読み出しを避ける
+    stop_loss_hit = False
+    if crypto_balance > min_balance:
+        if positions is not None:
+            position = positions.get(symbol)
+            stop_loss_hit = position is not None and should_stop_loss(
+                position.entry_price, current_price, symbol_config.stop_loss_percent
+            )
+        else:
+            stop_loss_hit = check_stop_loss(
+                symbol, current_price, symbol_config.stop_loss_percent
+            )
+
+    if stop_loss_hit:
+        amount = _floor_to_ticks(crypto_balance, ticks)
+        with _timed("create_order"):
+            order = exchange.create_market_sell_order(symbol, amount)
 
         result.action = "sell"
         result.signal = "stop_loss"
         result.amount = amount
         result.order_id = str(order.get("id"))
-        result.balance_jpy = float(balance.get("JPY", {}).get("free", 0))
-        result.balance_crypto = float(balance.get(crypto, {}).get("free", 0))
+        result.balance_jpy = jpy_balance + amount * current_price * (1 - TAKER_FEE)
+        result.balance_crypto = crypto_balance - amount
 
         clear_position(symbol)
-        logger.warning(f"[{symbol}] Stop loss executed!")
+        logger.warning("[%s] Stop loss executed!", symbol)
 
     # シグナルに基づいて取引
-    elif signal == Signal.BUY and jpy_balance > 1000:
+    elif signal is Signal.BUY and jpy_balance > 1000:
         jpy_to_use = jpy_balance * symbol_config.max_position_percent
-        amount = Decimal(str(jpy_to_use / current_price)).quantize(
-            order_unit, rounding=ROUND_DOWN
-        )
+        # 並行買いでは共有予算から引き当てる（残額がなければ0になり、
+        # 最小注文量に届かず発注されない）
+        if jpy_budget is not None:
+            jpy_to_use = jpy_budget.reserve(jpy_to_use)
+        amount = _floor_to_ticks(jpy_to_use / current_price, ticks)
 
         min_amount = exchange.get_min_order_amount(symbol)
-        if amount >= min_amount:
-            order = exchange.create_market_buy_order(symbol, float(amount))
-            balance = exchange.fetch_balance()
+        if amount >= float(min_amount):
+            with _timed("create_order"):
+                order = exchange.create_market_buy_order(symbol, amount)
 
             result.action = "buy"
             result.amount = amount
             result.order_id = str(order.get("id"))
-            result.balance_jpy = float(balance.get("JPY", {}).get("free", 0))
-            result.balance_crypto = float(balance.get(crypto, {}).get("free", 0))
+            result.balance_jpy = jpy_balance - amount * current_price * (1 + TAKER_FEE)
+            result.balance_crypto = crypto_balance + amount
+
+            if jpy_budget is not None:
+                # 切り捨てで使わなかった端数を予算に戻す
+                spent = amount * current_price * (1 + TAKER_FEE)
+                jpy_budget.release(jpy_to_use - spent)
 
             # 購入価格を記録
-            save_position(symbol, current_price, float(amount))
-            logger.info(f"[{symbol}] Buy executed: {amount} at {current_price}")
+            save_position(symbol, current_price, amount)
+            logger.info("[%s] Buy executed: %s at %s", symbol, amount, current_price)
+        elif jpy_budget is not None:
+            # 発注しない場合は引き当てた全額を戻す
+            jpy_budget.release(jpy_to_use)
 
-    elif signal == Signal.SELL and crypto_balance > min_balance:
-        amount = Decimal(str(crypto_balance)).quantize(order_unit, rounding=ROUND_DOWN)
-        order = exchange.create_market_sell_order(symbol, float(amount))
-        balance = exchange.fetch_balance()
+    elif signal is Signal.SELL and crypto_balance > min_balance:
+        amount = _floor_to_ticks(crypto_balance, ticks)
+        with _timed("create_order"):
+            order = exchange.create_market_sell_order(symbol, amount)
 
         result.action = "sell"
         result.amount = amount
         result.order_id = str(order.get("id"))
-        result.balance_jpy = float(balance.get("JPY", {}).get("free", 0))
-        result.balance_crypto = float(balance.get(crypto, {}).get("free", 0))
+        result.balance_jpy = jpy_balance + amount * current_price * (1 - TAKER_FEE)
+        result.balance_crypto = crypto_balance - amount
 
         # ポジション情報をクリア
         clear_position(symbol)
-        logger.info(f"[{symbol}] Sell executed: {amount} at {current_price}")
+        logger.info("[%s] Sell executed: %s at %s", symbol, amount, current_price)
 
     logger.info(
-        f"[{symbol}] Balance: JPY={jpy_balance:,.0f}, {crypto}={crypto_balance:.8f}"
+        "[%s] Balance: JPY=%.0f, %s=%.8f", symbol, jpy_balance, crypto, crypto_balance
     )
 
     return result
+
+
+def process_symbols(
+    exchange: Exchange,
+    config: Config,
+    symbol_configs: list[SymbolConfig],
+    positions: Optional[dict[str, Position]] = None,
+) -> list[TradeResult]:
+    """複数通貨ペアをスレッドプールで並行処理する。
+
+    process_symbolはREST往復（残高・価格・OHLCV・注文）の待ち時間が
+    支配的なため、シンボルごとに逐次実行すると合計レイテンシが
+    シンボル数に比例する。各シンボルを別スレッドで走らせることで
+    1シンボル分の時間にほぼ収まる（ccxtのbitFlyerクライアントは
+    スレッドセーフ）。
+
+    Args:
+        exchange: 取引所インスタンス
+        config: 設定
+        symbol_configs: 処理する通貨ペア設定のリスト
+        positions: 事前に一括ロードしたポジション（Noneの場合はここで
+            一括ロードする）
+
+    Returns:
+        symbol_configsと同じ順序の取引結果リスト。例外が発生した
+        シンボルはerrorフィールドに内容を入れて返す
+    """
+    # ポジションも1回だけ一括ロードして全ワーカーで共有する
+    # （シンボルごとのcheck_stop_loss → load_positionの往復を避ける）
+    if positions is None:
+        try:
+            positions = load_all_positions()
+        except Exception as e:
+            # 失敗時は各ワーカーがload_positionにフォールバックする
+            logger.warning("Position preload failed: %s", e)
+
+    # 残高はウォレット全体のスナップショットなので先に1回だけ取得し、
+    # 各ワーカーに使い回す（N回の同一REST呼び出しを1回に）
+    balance: Optional[dict] = None
+    try:
+        with _timed("fetch_balance"):
+            balance = exchange.fetch_balance()
+    except Exception as e:
+        # 取得失敗時は各ワーカーが自前で取得を試みる
+        logger.warning("Shared balance fetch failed: %s", e)
+
+    # 同一スナップショットからの並行買いが合計で残高を超えないよう、
+    # JPYの予算カウンターを全ワーカーで共有する
+    jpy_budget = _JpyBudget(_free(balance, "JPY")) if balance is not None else None
+
+    def _safe_process(symbol_config: SymbolConfig) -> TradeResult:
+        try:
+            return process_symbol(
+                exchange, config, symbol_config,
+                positions=positions, balance=balance,
+                jpy_budget=jpy_budget,
+            )
+        except Exception as e:
+            logger.error("[%s] Error: %s", symbol_config.symbol, e)
+            return TradeResult(
+                symbol=symbol_config.symbol,
+                strategy=symbol_config.strategy.value,
+                signal=Signal.HOLD.value,
+                price=0.0,
+                balance_jpy=0.0,
+                balance_crypto=0.0,
+                has_position=False,
+                error=str(e),
+            )
+
+    if len(symbol_configs) <= 1:
+        return [_safe_process(sc) for sc in symbol_configs]
+
+    with ThreadPoolExecutor(
+        max_workers=len(symbol_configs), thread_name_prefix="symbol"
+    ) as pool:
+        futures = [pool.submit(_safe_process, sc) for sc in symbol_configs]
+        return [future.result() for future in futures]
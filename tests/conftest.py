@@ -0,0 +1,53 @@
+"""テスト共通フィクスチャ。"""
+
+import pytest
+
+from src import position as position_module
+from src.position import Position
+
+
+@pytest.fixture
+def fake_position_store(monkeypatch, tmp_path):
+    """ローカルポジションストアをメモリ上の辞書に差し替える。
+
+    ロジックの検証にSQLiteへの往復は不要なため、*_local関数を辞書の
+    読み書きに置き換えてファイルI/Oをなくす。実DBの読み書き自体は
+    test_position.pyのスモークテスト1件で確認する。
+
+    Returns:
+        シンボル → Positionの辞書（テストから直接読み書きできる）
+    """
+    store: dict[str, Position] = {}
+
+    # 差し替え漏れの経路が実DBへ落ちても本番のlogs/には触れないよう、
+    # ストレージのパスも一時ディレクトリへ向けておく
+    monkeypatch.setattr(position_module, "POSITION_DB", tmp_path / "positions.db")
+    monkeypatch.setattr(
+        position_module, "POSITION_FILE", tmp_path / "position.json"
+    )
+
+    def fake_save(position: Position) -> None:
+        store[position.symbol] = position
+
+    def fake_load(symbol: str):
+        return store.get(symbol)
+
+    def fake_load_all() -> dict[str, Position]:
+        return dict(store)
+
+    def fake_clear(symbol: str | None = None) -> None:
+        if symbol is None:
+            store.clear()
+        else:
+            store.pop(symbol, None)
+
+    monkeypatch.setattr(position_module, "save_position_local", fake_save)
+    monkeypatch.setattr(position_module, "load_position_local", fake_load)
+    monkeypatch.setattr(position_module, "load_all_positions_local", fake_load_all)
+    monkeypatch.setattr(position_module, "clear_position_local", fake_clear)
+
+    # Supabase設定が環境に残っていてもローカル経路を通す
+    monkeypatch.delenv("SUPABASE_URL", raising=False)
+    monkeypatch.delenv("SUPABASE_KEY", raising=False)
+
+    return store
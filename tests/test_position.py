@@ -1,9 +1,5 @@
 """ポジション管理・損切りのテスト。"""
 
-import json
-import os
-import tempfile
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -11,7 +7,8 @@ import pytest
 from src.position import (
     Position,
     check_stop_loss,
-    clear_position_local,
+    clear_position,
+    load_position,
     load_position_local,
     save_position_local,
 )
@@ -19,157 +16,102 @@ from src.position import (
 
 @pytest.fixture
 def temp_position_file(tmp_path):
-    """一時的なポジションファイルを使用する。"""
-    position_file = tmp_path / "position.json"
-    with patch("src.position.POSITION_FILE", position_file):
-        yield position_file
+    """一時的なポジションDBを使用する。
+
+    旧JSON移行が本番のlogs/position.jsonへ触れないよう、
+    POSITION_FILEも一時パスへ差し替える。
+    """
+    position_db = tmp_path / "positions.db"
+    with patch("src.position.POSITION_DB", position_db), \
+         patch("src.position.POSITION_FILE", tmp_path / "position.json"):
+        yield position_db
+
+
+def _position(symbol: str = "BTC/JPY", entry_price: float = 1000000.0) -> Position:
+    """テスト用のポジションを生成する。"""
+    return Position(
+        symbol=symbol,
+        entry_price=entry_price,
+        amount=0.01,
+        entry_time="2025-01-01T00:00:00",
+    )
 
 
 class TestPositionLocal:
-    """ローカルファイルでのポジション管理テスト。"""
+    """ローカルポジション管理テスト。
+
+    SQLiteの読み書き自体はスモークテスト1件で確認し、残りは
+    fake_position_storeフィクスチャの辞書で高速に検証する。
+    """
 
     def test_save_and_load_position(self, temp_position_file):
-        """ポジションの保存と読み込みができること。"""
-        with patch("src.position.POSITION_FILE", temp_position_file):
-            position = Position(
-                symbol="BTC/JPY",
-                entry_price=1000000.0,
-                amount=0.01,
-                entry_time="2025-01-01T00:00:00",
-            )
-            save_position_local(position)
-
-            loaded = load_position_local("BTC/JPY")
-            assert loaded is not None
-            assert loaded.symbol == "BTC/JPY"
-            assert loaded.entry_price == 1000000.0
-            assert loaded.amount == 0.01
-
-    def test_load_nonexistent_position(self, temp_position_file):
+        """ポジションの保存と読み込みができること（実DBスモーク）。"""
+        save_position_local(_position())
+
+        loaded = load_position_local("BTC/JPY")
+        assert loaded is not None
+        assert loaded.symbol == "BTC/JPY"
+        assert loaded.entry_price == 1000000.0
+        assert loaded.amount == 0.01
+
+    def test_load_nonexistent_position(self, fake_position_store):
         """存在しないポジションを読み込むとNoneが返ること。"""
-        with patch("src.position.POSITION_FILE", temp_position_file):
-            loaded = load_position_local("BTC/JPY")
-            assert loaded is None
+        assert load_position("BTC/JPY") is None
 
-    def test_load_different_symbol(self, temp_position_file):
+    def test_load_different_symbol(self, fake_position_store):
         """異なるシンボルのポジションはNoneが返ること。"""
-        with patch("src.position.POSITION_FILE", temp_position_file):
-            position = Position(
-                symbol="ETH/JPY",
-                entry_price=500000.0,
-                amount=0.1,
-                entry_time="2025-01-01T00:00:00",
-            )
-            save_position_local(position)
-
-            loaded = load_position_local("BTC/JPY")
-            assert loaded is None
-
-    def test_clear_position(self, temp_position_file):
+        fake_position_store["ETH/JPY"] = _position("ETH/JPY", 500000.0)
+
+        assert load_position("BTC/JPY") is None
+
+    def test_multiple_symbols(self, fake_position_store):
+        """複数シンボルのポジションを同時に保持できること。"""
+        fake_position_store["BTC/JPY"] = _position("BTC/JPY", 1000000.0)
+        fake_position_store["ETH/JPY"] = _position("ETH/JPY", 500000.0)
+
+        assert load_position("BTC/JPY").entry_price == 1000000.0
+        assert load_position("ETH/JPY").entry_price == 500000.0
+
+        clear_position("BTC/JPY")
+        assert "BTC/JPY" not in fake_position_store
+        assert load_position("ETH/JPY") is not None
+
+    def test_clear_position(self, fake_position_store):
         """ポジションのクリアができること。"""
-        with patch("src.position.POSITION_FILE", temp_position_file):
-            position = Position(
-                symbol="BTC/JPY",
-                entry_price=1000000.0,
-                amount=0.01,
-                entry_time="2025-01-01T00:00:00",
-            )
-            save_position_local(position)
-            assert temp_position_file.exists()
+        fake_position_store["BTC/JPY"] = _position()
+        assert load_position("BTC/JPY") is not None
 
-            clear_position_local()
-            assert not temp_position_file.exists()
+        clear_position("BTC/JPY")
+        assert "BTC/JPY" not in fake_position_store
 
 
 class TestStopLoss:
     """損切り判定のテスト。"""
 
-    def test_stop_loss_triggered(self, temp_position_file):
-        """10%下落で損切りが発動すること。"""
-        with patch("src.position.POSITION_FILE", temp_position_file):
-            # 購入価格: 100万円
-            position = Position(
-                symbol="BTC/JPY",
-                entry_price=1000000.0,
-                amount=0.01,
-                entry_time="2025-01-01T00:00:00",
-            )
-            save_position_local(position)
-
-            # 現在価格: 89万円（11%下落）→ 損切り発動
-            result = check_stop_loss("BTC/JPY", 890000.0, 0.10)
-            assert result is True
-
-    def test_stop_loss_not_triggered(self, temp_position_file):
-        """10%未満の下落では損切りが発動しないこと。"""
-        with patch("src.position.POSITION_FILE", temp_position_file):
-            # 購入価格: 100万円
-            position = Position(
-                symbol="BTC/JPY",
-                entry_price=1000000.0,
-                amount=0.01,
-                entry_time="2025-01-01T00:00:00",
-            )
-            save_position_local(position)
-
-            # 現在価格: 91万円（9%下落）→ 損切り発動しない
-            result = check_stop_loss("BTC/JPY", 910000.0, 0.10)
-            assert result is False
-
-    def test_stop_loss_exact_threshold(self, temp_position_file):
-        """ちょうど10%下落で損切りが発動すること。"""
-        with patch("src.position.POSITION_FILE", temp_position_file):
-            # 購入価格: 100万円
-            position = Position(
-                symbol="BTC/JPY",
-                entry_price=1000000.0,
-                amount=0.01,
-                entry_time="2025-01-01T00:00:00",
-            )
-            save_position_local(position)
-
-            # 現在価格: 90万円（ちょうど10%下落）→ 損切り発動
-            result = check_stop_loss("BTC/JPY", 900000.0, 0.10)
-            assert result is True
-
-    def test_stop_loss_no_position(self, temp_position_file):
+    @pytest.fixture(autouse=True)
+    def saved_position(self, fake_position_store):
+        """購入価格100万円のポジションを保存しておく。"""
+        fake_position_store["BTC/JPY"] = _position()
+        yield
+        fake_position_store.clear()
+
+    @pytest.mark.parametrize(
+        "price,percent,expected",
+        [
+            (890000.0, 0.10, True),  # 11%下落 → 発動
+            (910000.0, 0.10, False),  # 9%下落 → 発動しない
+            (900000.0, 0.10, True),  # ちょうど10%下落 → 発動
+            (1100000.0, 0.10, False),  # 10%上昇 → 発動しない
+            (940000.0, 0.05, True),  # 5%設定で6%下落 → 発動
+            (960000.0, 0.05, False),  # 5%設定で4%下落 → 発動しない
+        ],
+    )
+    def test_stop_loss(self, price, percent, expected):
+        """下落率と損切り設定の組み合わせで判定が正しいこと。"""
+        assert check_stop_loss("BTC/JPY", price, percent) is expected
+
+    def test_stop_loss_no_position(self, fake_position_store):
         """ポジションがない場合は損切りが発動しないこと。"""
-        with patch("src.position.POSITION_FILE", temp_position_file):
-            result = check_stop_loss("BTC/JPY", 890000.0, 0.10)
-            assert result is False
-
-    def test_stop_loss_price_increase(self, temp_position_file):
-        """価格上昇時は損切りが発動しないこと。"""
-        with patch("src.position.POSITION_FILE", temp_position_file):
-            # 購入価格: 100万円
-            position = Position(
-                symbol="BTC/JPY",
-                entry_price=1000000.0,
-                amount=0.01,
-                entry_time="2025-01-01T00:00:00",
-            )
-            save_position_local(position)
-
-            # 現在価格: 110万円（10%上昇）→ 損切り発動しない
-            result = check_stop_loss("BTC/JPY", 1100000.0, 0.10)
-            assert result is False
-
-    def test_stop_loss_custom_percent(self, temp_position_file):
-        """カスタム損切りパーセンテージが機能すること。"""
-        with patch("src.position.POSITION_FILE", temp_position_file):
-            # 購入価格: 100万円
-            position = Position(
-                symbol="BTC/JPY",
-                entry_price=1000000.0,
-                amount=0.01,
-                entry_time="2025-01-01T00:00:00",
-            )
-            save_position_local(position)
-
-            # 5%の損切り設定で、6%下落 → 損切り発動
-            result = check_stop_loss("BTC/JPY", 940000.0, 0.05)
-            assert result is True
-
-            # 5%の損切り設定で、4%下落 → 損切り発動しない
-            result = check_stop_loss("BTC/JPY", 960000.0, 0.05)
-            assert result is False
+        fake_position_store.clear()
+
+        assert check_stop_loss("BTC/JPY", 890000.0, 0.10) is False